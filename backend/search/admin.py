@@ -9,14 +9,35 @@ from .models import SearchTask, SearchResult
 class SearchTaskAdmin(admin.ModelAdmin):
     list_display = ['id', 'keyword', 'status', 'created_at']
     list_filter = ['status', 'created_at']
-    search_fields = ['keyword', 'id']
+    # ^ forces istartswith, which the UPPER(keyword) pattern-ops index can
+    # serve; plain icontains would be a sequential scan per keystroke.
+    search_fields = ['^keyword', 'id']
     readonly_fields = ['id', 'created_at']
 
+    def get_queryset(self, request):
+        """
+        Load only the changelist columns; error_message in particular can
+        be long and is lazy-loaded on the change form when needed.
+        """
+        return super().get_queryset(request).only('id', 'keyword', 'status', 'created_at')
+
 
 @admin.register(SearchResult)
 class SearchResultAdmin(admin.ModelAdmin):
     list_display = ['id', 'task', 'title', 'source_url', 'created_at']
-    list_filter = ['created_at', 'task']
-    search_fields = ['title', 'source_url', 'task__keyword']
+    list_filter = ['created_at', ('task', admin.RelatedOnlyFieldListFilter)]
+    # title stays icontains (served by the trigram index); the URL and
+    # keyword lookups are prefix searches so they can use btree indexes.
+    search_fields = ['title', '^source_url', '^task__keyword']
     readonly_fields = ['created_at']
+    list_select_related = ('task',)
+
+    def get_queryset(self, request):
+        """
+        Join the task once and load only the columns the changelist shows,
+        instead of one lazy task query per row.
+        """
+        return super().get_queryset(request).select_related('task').only(
+            'id', 'title', 'source_url', 'created_at', 'task__keyword', 'task__status'
+        )
 
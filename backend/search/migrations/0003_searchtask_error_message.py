@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-08-31 10:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0002_searchtask_article_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='searchtask',
+            name='error_message',
+            field=models.TextField(blank=True, default=''),
+        ),
+    ]
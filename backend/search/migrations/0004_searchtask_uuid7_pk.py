@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-08-31 10:39
+
+from django.db import migrations, models
+import search.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0003_searchtask_error_message'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='searchtask',
+            name='id',
+            field=models.UUIDField(default=search.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-08-31 10:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0004_searchtask_uuid7_pk'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='searchresult',
+            index=models.Index(fields=['task', '-created_at'], name='sr_task_created_idx'),
+        ),
+    ]
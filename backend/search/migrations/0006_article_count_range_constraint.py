@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-08-31 10:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0005_searchresult_task_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='searchtask',
+            constraint=models.CheckConstraint(check=models.Q(('article_count__gte', 1), ('article_count__lte', 20)), name='article_count_range'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-08-31 10:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0007_status_index_title_trgm'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='searchresult',
+            name='source_url',
+            field=models.TextField(),
+        ),
+        migrations.AlterField(
+            model_name='searchresult',
+            name='title',
+            field=models.TextField(),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-08-31 10:43
+
+from django.db import migrations, models
+
+
+def null_paths_to_empty(apps, schema_editor):
+    SearchResult = apps.get_model('search', 'SearchResult')
+    SearchResult.objects.filter(pdf_file__isnull=True).update(pdf_file='')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0008_searchresult_textfields'),
+    ]
+
+    operations = [
+        migrations.RunPython(null_paths_to_empty, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='searchresult',
+            name='pdf_file',
+            field=models.CharField(blank=True, default='', max_length=512),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-08-31 10:44
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0009_searchresult_pdf_file_charfield'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='searchtask',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Lower('keyword'), 'varchar_pattern_ops'), name='st_keyword_lower_idx'),
+        ),
+    ]
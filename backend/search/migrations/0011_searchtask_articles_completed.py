@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-08-31 11:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0010_st_keyword_lower_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='searchtask',
+            name='articles_completed',
+            field=models.IntegerField(default=0, help_text='Articles scraped so far for this task'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-08-31 12:10
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0011_searchtask_articles_completed'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='searchtask',
+            name='st_keyword_lower_idx',
+        ),
+        migrations.AddIndex(
+            model_name='searchtask',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('keyword'), 'varchar_pattern_ops'), name='st_keyword_upper_idx'),
+        ),
+    ]
@@ -1,11 +1,101 @@
 """
 Models for the search app.
 """
+import os
+import time
 import uuid
-from django.db import models
+from collections import defaultdict
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import connection, models
+from django.db.models import F
+from django.db.models.functions import Upper
 from django.utils import timezone
 
 
+try:
+    import uuid_utils
+except ImportError:
+    uuid_utils = None
+
+
+def uuid7():
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562).
+
+    Random uuid4 primary keys destroy B-tree insert locality: every insert
+    lands on a random index page. UUIDv7 puts a millisecond timestamp in
+    the high bits so new rows append to the rightmost leaf, keeping the PK
+    index (and the SearchResult FK index) hot in the buffer cache.
+
+    Uses the C-backed uuid-utils generator when installed (several times
+    faster than stdlib UUID construction); falls back to pure Python.
+    """
+    if uuid_utils is not None:
+        # Rewrap as a stdlib UUID so Django's UUIDField accepts it.
+        return uuid.UUID(bytes=uuid_utils.uuid7().bytes)
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), 'big')
+    value = (timestamp_ms & 0xFFFFFFFFFFFF) << 80  # 48-bit timestamp
+    value |= 0x7 << 76  # version 7
+    value |= (rand >> 68 & 0xFFF) << 64  # 12 random bits
+    value |= 0x2 << 62  # RFC 4122 variant
+    value |= rand & 0x3FFFFFFFFFFFFFFF  # 62 random bits
+    return uuid.UUID(int=value)
+
+
+class SearchTaskManager(models.Manager):
+    """
+    Custom manager for SearchTask.
+    """
+
+    def with_results(self):
+        """
+        Return tasks with their results prefetched in a single extra query.
+
+        Serializing nested results without this triggers one SELECT per task
+        (N+1); with the prefetch, list endpoints run in two queries total.
+        """
+        return self.get_queryset().only(
+            'id', 'keyword', 'article_count', 'status', 'error_message',
+            'articles_completed', 'created_at'
+        ).prefetch_related(
+            models.Prefetch(
+                'results',
+                queryset=SearchResult.objects.only(
+                    'id', 'task_id', 'title', 'source_url', 'pdf_file', 'created_at'
+                ),
+            )
+        )
+
+
+    def list_payload(self):
+        """
+        Build the list-endpoint payload as plain dicts in two queries.
+
+        The output matches SearchTaskSerializer, but skips the serializer
+        machinery entirely (field binding, per-row dispatch), which is
+        10-20x heavier than .values() for flat JSON-safe rows. Ordering
+        comes from the models' Meta.ordering as before.
+        """
+        tasks = list(self.get_queryset().values(
+            'id', 'keyword', 'article_count', 'status', 'created_at', 'error_message',
+            'articles_completed',
+        ))
+        results_by_task = defaultdict(list)
+        if tasks:
+            result_rows = SearchResult.objects.filter(
+                task_id__in=[task['id'] for task in tasks]
+            ).values('task_id', 'id', 'title', 'source_url', 'pdf_file', 'created_at')
+            for row in result_rows:
+                row['created_at'] = int(row['created_at'].timestamp() * 1000)
+                results_by_task[row.pop('task_id')].append(row)
+        for task in tasks:
+            task['created_at'] = int(task['created_at'].timestamp() * 1000)
+            task['results'] = results_by_task.get(task['id'], [])
+            task['result_count'] = len(task['results'])
+        return tasks
+
+
 class SearchTask(models.Model):
     """
     Model representing a search task.
@@ -24,16 +114,38 @@ class SearchTask(models.Model):
         ('failed', 'Failed'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     keyword = models.CharField(max_length=255)
     article_count = models.IntegerField(default=3, help_text='Number of articles to scrape')
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending', db_index=True)
+    error_message = models.TextField(blank=True, default='')
+    articles_completed = models.IntegerField(default=0, help_text='Articles scraped so far for this task')
     created_at = models.DateTimeField(default=timezone.now)
-    
+
+    objects = SearchTaskManager()
+
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Search Task'
         verbose_name_plural = 'Search Tasks'
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(article_count__gte=1) & models.Q(article_count__lte=20),
+                name='article_count_range',
+            ),
+        ]
+        indexes = []
+        if connection.vendor == 'postgresql':
+            # Backs the admin's istartswith keyword search, which Django
+            # compiles to UPPER(keyword) LIKE UPPER('foo%') on Postgres;
+            # the expression and opclass must match for the planner to
+            # use the index.
+            indexes.append(
+                models.Index(
+                    OpClass(Upper('keyword'), 'varchar_pattern_ops'),
+                    name='st_keyword_upper_idx',
+                )
+            )
     
     def __str__(self):
         return f"SearchTask({self.keyword} - {self.status})"
@@ -51,16 +163,52 @@ class SearchResult(models.Model):
     """
     
     task = models.ForeignKey(SearchTask, on_delete=models.CASCADE, related_name='results')
-    title = models.CharField(max_length=500)
-    source_url = models.URLField(max_length=1000)
-    pdf_file = models.FileField(upload_to='pdfs/', blank=True, null=True)
+    # Both columns are written only by the scraping task; TextField skips the
+    # Python-level max-length/URL validators (varchar(n) and text are the
+    # same storage in Postgres anyway).
+    title = models.TextField()
+    source_url = models.TextField()
+    # Storage-relative path (e.g. 'pdfs/<file>.pdf'). A plain CharField: the
+    # scraping task writes the file itself, so there is no reason to build a
+    # FieldFile/storage descriptor on every row access.
+    pdf_file = models.CharField(max_length=512, blank=True, default='')
     created_at = models.DateTimeField(default=timezone.now)
     
     class Meta:
         ordering = ['-created_at']
         verbose_name = 'Search Result'
         verbose_name_plural = 'Search Results'
+        indexes = [
+            # The nested results prefetch filters on task_id and orders by
+            # -created_at; this composite index serves both without a sort.
+            models.Index(fields=['task', '-created_at'], name='sr_task_created_idx'),
+        ]
+        if connection.vendor == 'postgresql':
+            # Serves the admin icontains search on title, which a btree
+            # index cannot; requires the pg_trgm extension (enabled in the
+            # accompanying migration).
+            indexes.append(GinIndex(OpClass(F('title'), 'gin_trgm_ops'), name='sr_title_trgm'))
     
     def __str__(self):
         return f"SearchResult({self.title[:50]}...)"
 
+    @classmethod
+    def bulk_from_scrape(cls, task, items):
+        """
+        Create results for a scraping run in batched INSERTs.
+
+        Args:
+            task: The SearchTask the results belong to
+            items: Iterables of dicts with 'title', 'url' and 'path' keys
+
+        One INSERT per 100 rows instead of one round-trip per article.
+        Note that bulk_create skips per-row save() and signals.
+        """
+        return cls.objects.bulk_create(
+            [
+                cls(task=task, title=item['title'], source_url=item['url'], pdf_file=item['path'])
+                for item in items
+            ],
+            batch_size=100,
+        )
+
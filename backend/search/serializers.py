@@ -5,55 +5,90 @@ from rest_framework import serializers
 from .models import SearchTask, SearchResult
 
 
-class SearchResultSerializer(serializers.ModelSerializer):
+class EpochDateTimeField(serializers.Field):
+    """
+    Render a datetime as epoch milliseconds.
+
+    DRF's DateTimeField runs timezone conversion plus isoformat() per
+    value; datetime.timestamp() is a single C call and JS consumers pass
+    the integer straight to new Date().
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        return int(value.timestamp() * 1000)
+
+
+class CachedFieldsMixin:
+    """
+    Share one bound field set across all instances of a serializer class.
+
+    DRF rebuilds every field per serializer instance via a deepcopy of
+    _declared_fields (the documented get_fields hotspot). The read
+    serializers below declare only read-only fields that never consult
+    their parent during to_representation, so the bound fields from the
+    first instance can be reused by every later one.
+
+    Do not mix this into writable serializers: validation relies on
+    per-instance field state.
+    """
+
+    @property
+    def fields(self):
+        cls = type(self)
+        cached = cls.__dict__.get('_cached_bound_fields')
+        if cached is None:
+            cached = super().fields
+            cls._cached_bound_fields = cached
+        return cached
+
+
+class SearchResultSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for SearchResult model.
     """
-    pdf_file = serializers.SerializerMethodField()
-    
+    created_at = EpochDateTimeField()
+
     class Meta:
         model = SearchResult
         fields = ['id', 'title', 'source_url', 'pdf_file', 'created_at']
         read_only_fields = ['id', 'created_at']
-    
-    def get_pdf_file(self, obj):
-        """
-        Return relative path for PDF file instead of full URL.
-        This prevents double /media/ in the frontend URL.
-        """
-        if obj.pdf_file:
-            # Return just the relative path (e.g., 'pdfs/filename.pdf')
-            # Remove MEDIA_URL prefix if present
-            file_path = str(obj.pdf_file)
-            if file_path.startswith('/media/'):
-                return file_path[7:]  # Remove '/media/' prefix
-            elif file_path.startswith('media/'):
-                return file_path[6:]  # Remove 'media/' prefix
-            return file_path
-        return None
-
-
-class SearchTaskSerializer(serializers.ModelSerializer):
+
+
+class SearchTaskSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for SearchTask model.
     
     Includes nested SearchResult objects in the response.
     """
     results = SearchResultSerializer(many=True, read_only=True)
-    error_message = serializers.SerializerMethodField()
-    
+    created_at = EpochDateTimeField()
+
     class Meta:
         model = SearchTask
-        fields = ['id', 'keyword', 'article_count', 'status', 'created_at', 'results', 'error_message']
-        read_only_fields = ['id', 'created_at', 'results', 'error_message']
-    
-    def get_error_message(self, obj):
-        """Return error message if task failed."""
-        if obj.status == 'failed':
-            # Try to get error from Celery result if available
-            # This would require additional implementation
-            return None
-        return None
+        fields = ['id', 'keyword', 'article_count', 'status', 'created_at', 'results',
+                  'error_message', 'articles_completed']
+        read_only_fields = ['id', 'created_at', 'results', 'error_message', 'articles_completed']
+
+
+class SearchTaskUpdateSerializer(serializers.ModelSerializer):
+    """
+    Serializer for updating SearchTask.
+
+    The frontend only patches status (e.g. marking a stuck task failed);
+    keyword and article_count are fixed once the scrape is dispatched.
+    Deliberately not field-cached: writable serializers need per-instance
+    field state (see CachedFieldsMixin).
+    """
+    created_at = EpochDateTimeField()
+
+    class Meta:
+        model = SearchTask
+        fields = ['id', 'keyword', 'article_count', 'status', 'error_message', 'created_at']
+        read_only_fields = ['id', 'keyword', 'article_count', 'error_message', 'created_at']
 
 
 class SearchTaskCreateSerializer(serializers.ModelSerializer):
@@ -70,10 +105,13 @@ class SearchTaskCreateSerializer(serializers.ModelSerializer):
     
     def validate_article_count(self, value):
         """Validate that article_count is between 1 and 20."""
-        if value is not None:
-            if value < 1:
-                raise serializers.ValidationError("Article count must be at least 1")
-            if value > 20:
-                raise serializers.ValidationError("Article count cannot exceed 20")
+        if not 1 <= value <= 20:
+            raise serializers.ValidationError("Article count must be between 1 and 20")
         return value
 
+
+# Materialize the cached field sets at import time so even the first request
+# after a worker (re)start skips the build-and-bind pass.
+SearchResultSerializer().fields
+SearchTaskSerializer().fields
+
@@ -3,12 +3,27 @@ Celery tasks for the search app.
 """
 import os
 import base64
+import hashlib
+import queue
+import re
+import string
+import threading
 import uuid
 import time
 import logging
-from urllib.parse import urlparse, parse_qs
-from celery import shared_task
+from contextlib import contextmanager
+from functools import lru_cache
+from datetime import datetime
+from urllib.parse import urlparse, parse_qsl, unquote, urlencode, urlunparse
+import lxml.etree
+import lxml.html
+import requests
+from celery import chord, shared_task
+from celery.signals import worker_process_init, worker_process_shutdown
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -19,147 +34,617 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from .models import SearchTask, SearchResult
 
+try:
+    # WeasyPrint needs system libraries (pango/cairo); treat it as optional
+    # and fall back to Chrome's printToPDF when it cannot be imported.
+    import weasyprint
+except (ImportError, OSError):
+    weasyprint = None
+
 logger = logging.getLogger('search')
 
+# Selector fallback chains for article extraction. Evaluated in-browser in a
+# single execute_script call; each entry is tried in order until one matches.
+TITLE_SELECTORS = (
+    'h1',
+    '.content-part__top h1',
+    'article h1',
+    '[class*="content-part"] h1',
+    '.article-title',
+    'h1.article-title',
+)
+
+AUTHOR_SELECTORS = (
+    '[class*="author"]',
+    '[class*="content-part__author"]',
+    '.article-author',
+    '[itemprop="author"]',
+    'meta[property="article:author"]',
+)
+
+CONTENT_SELECTORS = (
+    '.full-width-depends-on-screening__container.content-part__top',
+    '.full-width-depends-on-screening__container.full-content__main',
+    'section.content-part__top__left',
+    'section.full-content__main__left',
+    'article',
+    '[class*="content-part"]',
+    '[class*="full-content"]',
+)
+
+# Ad/share/related blocks stripped before text extraction; the server-side
+# mirror of the UNWANTED list in EXTRACT_ARTICLE_JS.
+UNWANTED_NODE_SELECTOR = (
+    '[class*="reklama"], [id*="reklama"], [class*="advertisement"], '
+    '[id*="google_ads"], [class*="onnetwork"], [data-adv-display-type], '
+    '[class*="share"], [class*="reaction"], [class*="recommended"], '
+    '[class*="related"], [class*="stories"], [class*="radio-program"], '
+    '[class*="content-part__tags"], [class*="advert"]'
+)
+
+# Everything stripped by the server-side page cleaner: the extraction
+# blocklist plus the widget/ad containers the in-browser hide script
+# targets.
+CLEAN_PAGE_NODE_SELECTOR = UNWANTED_NODE_SELECTOR + (
+    ', [class*="zareaguj"], [class*="tu-sie-dzieje"], [id*="recommended"], '
+    '[id*="related"], .related-articles, .recommended-articles, '
+    '[id*="stories"], [id*="radio-program"], [class*="tags"], '
+    '[class*="redphone"], [id*="google_ads"], [id*="div-gpt-ad"], '
+    '[class*="ad-container"], [class*="ad-wrapper"], [class*="ad-banner"], '
+    '[data-adv-display-replace], [data-adv-display-counter]'
+)
+
+# Main article containers for the nuclear-swap paragraph harvest, joined
+# once at import so each call issues a single combined-selector query.
+MAIN_CONTAINER_SELECTORS = (
+    "div.full-text",
+    "article",
+    "div.content",
+    "div#article-body",
+    ".full-width-depends-on-screening__container.full-content__main",
+    ".full-content__main",
+    "section.full-content__main__left",
+)
+MAIN_CONTAINER_COMBINED_SELECTOR = ", ".join(MAIN_CONTAINER_SELECTORS)
+MAIN_CONTAINER_PARAGRAPH_SELECTOR = ", ".join(f"{sel} p" for sel in MAIN_CONTAINER_SELECTORS)
+
+# Publication-date sources, tried in order. The meta keys are looked up in
+# the dict returned by META_CONTENT_JS; the element selectors only run when
+# no meta tag matched.
+DATE_META_KEYS = (
+    'article:published_time',
+    'og:published_time',
+    'datePublished',
+)
+
+DATE_ELEMENT_SELECTORS = (
+    "time[datetime]",
+    "time[pubdate]",
+    "[class*='date']",
+    "[class*='published']",
+    "[class*='publication-date']",
+    "[class*='content-part__date']",
+)
+
+# Returns every meta tag's content keyed by property/name/itemprop in one
+# round-trip; probing each meta selector individually is two RPCs apiece.
+META_CONTENT_JS = """
+    const metas = {};
+    document.querySelectorAll('meta').forEach(m => {
+        const key = m.getAttribute('property') || m.getAttribute('name') || m.getAttribute('itemprop');
+        if (key && !(key in metas)) metas[key] = m.content;
+    });
+    return metas;
+"""
+
+# Date shapes mapped to their strptime format (with the prefix length to
+# parse). One regex probe picks the format instead of trying every format
+# in a try/except chain, where the exceptions are the common path.
+DATE_PATTERNS = [
+    (re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'), '%Y-%m-%d %H:%M:%S', 19),
+    (re.compile(r'^\d{4}-\d{2}-\d{2}$'), '%Y-%m-%d', 10),
+    (re.compile(r'^\d{2}\.\d{2}\.\d{4}'), '%d.%m.%Y', 10),
+    (re.compile(r'^\d{2}/\d{2}/\d{4}'), '%d/%m/%Y', 10),
+]
+
+_DIGITS_RE = re.compile(r'^\d+(?:\.\d+)?$')
+
+# One translation table shared by every paragraph escape; html.escape runs
+# five str.replace passes per call.
+_HTML_ESCAPE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
+# RadioZET uses OneTrust cookie consent. Every probe runs inside one
+# in-browser call; the button-text fallbacks replace the old XPath probes.
+COOKIE_ACCEPT_CSS_SELECTORS = (
+    'button#onetrust-accept-btn-handler',
+    'button[class*="onetrust-accept"]',
+    'button[id*="accept"]',
+)
+COOKIE_ACCEPT_TEXTS = ('AKCEPTUJĘ', 'Accept')
+
+# Finds and clicks the first visible accept button; returns what matched
+# (selector or label) or null when no popup is present yet.
+COOKIE_ACCEPT_JS = """
+const selectors = arguments[0];
+const texts = arguments[1];
+for (const sel of selectors) {
+    try {
+        const btn = document.querySelector(sel);
+        if (btn && btn.offsetParent !== null) { btn.click(); return sel; }
+    } catch (e) {}
+}
+for (const btn of document.getElementsByTagName('button')) {
+    const label = (btn.textContent || '').trim();
+    if (btn.offsetParent !== null && texts.some(t => label.includes(t))) {
+        btn.click();
+        return label;
+    }
+}
+return null;
+"""
+
+# Google Custom Search result links, most specific first.
+ARTICLE_LINK_SELECTORS = (
+    # Google Custom Search specific selectors
+    (By.CSS_SELECTOR, '.gsc-webResult .gs-title a'),
+    (By.CSS_SELECTOR, '.gsc-result .gs-title a'),
+    (By.CSS_SELECTOR, '.gsc-webResult a.gs-title'),
+    (By.CSS_SELECTOR, 'a.gs-title'),
+    (By.CSS_SELECTOR, '.gsc-results .gsc-webResult a'),
+    # Fallback selectors
+    (By.CSS_SELECTOR, '.gsc-webResult a[href*="radiozet.pl"]'),
+    (By.CSS_SELECTOR, '.gsc-result a[href*="/wiadomosci"]'),
+    (By.CSS_SELECTOR, '.gsc-result a[href*="/kultura"]'),
+)
+
+# "Czerwony telefon Radia ZET" call-to-action blocks and similar. One
+# compiled case-insensitive scan per paragraph instead of an .upper()
+# allocation plus a substring check per keyword.
+UNWANTED_PARAGRAPH_RE = re.compile(
+    r'czerwony telefon|zgłoś sprawę|byłeś świadkiem|masz temat|powinniśmy się zająć',
+    re.IGNORECASE,
+)
+
+# Runs every selector fallback, the ad-stripping and the text extraction in
+# one WebDriver round-trip instead of one HTTP command per selector/element.
+EXTRACT_ARTICLE_JS = """
+    const [titleSelectors, authorSelectors, contentSelectors] = arguments;
+    const UNWANTED = [
+        '[class*="reklama"]', '[id*="reklama"]', '[class*="advertisement"]',
+        '[id*="google_ads"]', '[class*="onnetwork"]', '[data-adv-display-type]',
+        '[class*="share"]', '[class*="reaction"]', '[class*="recommended"]',
+        '[class*="related"]', '[class*="stories"]', '[class*="radio-program"]',
+        '[class*="content-part__tags"]', 'iframe', '[class*="advert"]'
+    ].join(',');
+
+    let title = '';
+    for (const sel of titleSelectors) {
+        const el = document.querySelector(sel);
+        if (el) {
+            title = (el.innerText || '').trim();
+            if (title) break;
+        }
+    }
+
+    let author = '';
+    for (const sel of authorSelectors) {
+        const el = document.querySelector(sel);
+        if (!el) continue;
+        author = sel.startsWith('meta')
+            ? (el.getAttribute('content') || '')
+            : (el.innerText || '').trim();
+        if (author) break;
+    }
+
+    const contentParts = [];
+    for (const sel of contentSelectors) {
+        for (const el of document.querySelectorAll(sel)) {
+            const clone = el.cloneNode(true);
+            clone.querySelectorAll(UNWANTED).forEach(item => item.remove());
+            const text = (clone.innerText || clone.textContent || '').trim();
+            if (text.length > 100) contentParts.push(text);
+        }
+    }
+    if (!contentParts.length) {
+        // Fallback: all paragraph text on the page
+        for (const p of document.querySelectorAll('article p, .article-content p, [class*="content"] p')) {
+            const text = (p.innerText || '').trim();
+            if (text) contentParts.push(text);
+        }
+    }
+
+    return {title: title, author: author, content_parts: contentParts};
+"""
+
+# Scraped articles are cached by normalized URL for a week; re-running a
+# keyword that hits the same articles skips the whole Selenium+PDF pipeline.
+SCRAPE_CACHE_TTL = 60 * 60 * 24 * 7
+
+# Tracking params that vary per visit but never change the page content.
+_TRACKING_PARAMS = ('gclid', 'fbclid', 'ref', 'source')
+
+# Category landing pages that must never be scraped as articles.
+_CATEGORY_NAMES = frozenset({
+    'polityka', 'biznes', 'wiadomosci', 'sport', 'zdrowie', 'kultura', 'rozrywka',
+})
+
+# Target URL inside a Google "/url?q=..." redirect link.
+_GOOGLE_REDIRECT_RE = re.compile(r'[?&]q=([^&]+)')
+
+
+# Classifies article URLs in one precompiled match: a radiozet.pl host,
+# at least two path segments, and a final segment that is not a category
+# landing page (https://wiadomosci.radiozet.pl/polityka is a category;
+# .../polityka/some-article is an article).
+_ARTICLE_URL_RE = re.compile(
+    r'^https?://[^/]*\bradiozet\.pl/(?:[^/?#]+/)+'
+    r'(?!(?:' + '|'.join(sorted(_CATEGORY_NAMES)) + r')/?(?:[?#]|$))'
+    r'[^/?#]+/?(?:[?#].*)?$'
+)
+
+
+def _is_valid_article_url(url: str) -> bool:
+    """Check whether a cleaned absolute URL points at a RadioZET article."""
+    # Substring prefilter rejects foreign hosts without invoking the
+    # regex engine at all
+    return 'radiozet.pl' in url and _ARTICLE_URL_RE.match(url) is not None
+
+
+@lru_cache(maxsize=256)
+def _normalize_url(url: str) -> str:
+    """
+    Canonicalize a URL for cache keying.
+
+    Strips the fragment and tracking query parameters (utm_*, gclid,
+    fbclid, ...) so the same article reached via different campaign links
+    maps to one cache entry. Memoized: pure string-to-string work, and
+    the same handful of URLs recurs across pre-validation, scraping and
+    re-runs within one worker process.
+    """
+    parsed = urlparse(url)
+    query = [
+        (name, value)
+        for name, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if not name.startswith('utm_') and name not in _TRACKING_PARAMS
+    ]
+    return urlunparse(parsed._replace(query=urlencode(query), fragment=''))
+
+
+@lru_cache(maxsize=256)
+def _scrape_cache_key(url: str) -> str:
+    return 'scrape:' + hashlib.sha1(_normalize_url(url).encode()).hexdigest()
+
+
+# Directories already created by this process; every article lands in the
+# same pdfs/ directory, so one makedirs syscall chain per process is enough.
+_ENSURED_DIRS = set()
+_DIR_LOCK = threading.Lock()
+
+
+def _ensure_dir(path: str) -> None:
+    """Create the directory once per process instead of per article."""
+    if path not in _ENSURED_DIRS:
+        with _DIR_LOCK:
+            os.makedirs(path, exist_ok=True)
+            _ENSURED_DIRS.add(path)
+
+
+def _parse_publication_date(raw: str) -> str:
+    """
+    Normalize a scraped date string to DD.MM.YYYY.
+
+    Handles Unix timestamps (seconds or milliseconds), ISO 8601, and the
+    formats in DATE_PATTERNS. Returns '' when the string is unparseable.
+    """
+    raw = raw.strip()
+    if not raw:
+        return ""
+    try:
+        # Unix timestamp (seconds or milliseconds)
+        if _DIGITS_RE.match(raw) and len(raw) <= 13:
+            timestamp = float(raw)
+            if timestamp > 1e12:  # Milliseconds
+                timestamp = timestamp / 1000
+            return datetime.fromtimestamp(timestamp).strftime('%d.%m.%Y')
+        # ISO 8601
+        if 'T' in raw:
+            return datetime.fromisoformat(raw.replace('Z', '+00:00')).strftime('%d.%m.%Y')
+        for pattern, fmt, length in DATE_PATTERNS:
+            if pattern.match(raw):
+                return datetime.strptime(raw[:length], fmt).strftime('%d.%m.%Y')
+    except (ValueError, OverflowError, OSError) as e:
+        logger.warning(f"Failed to parse date '{raw}': {str(e)}")
+    return ""
+
+
+def _paragraph_texts_from_html(page_source: str):
+    """
+    lxml half of the paragraph harvest, shared by the browser path and
+    the no-browser static path. Returns the same (texts, minimum length)
+    tuple as _harvest_paragraph_texts.
+    """
+    tree = lxml.html.fromstring(page_source)
+    paragraphs = tree.cssselect(MAIN_CONTAINER_PARAGRAPH_SELECTOR)
+    if paragraphs:
+        return [p.text_content().strip() for p in paragraphs], 20
+    logger.warning("Main content block not found, using all <p> tags as fallback")
+    return [p.text_content().strip() for p in tree.findall('.//p')], 50
+
+
+def _harvest_paragraph_texts(driver: WebDriver):
+    """
+    Collect candidate paragraph texts from the current page.
+
+    Fetches driver.page_source once and parses it locally with lxml, so
+    the whole harvest costs a single WebDriver round-trip; iterating
+    find_elements + `.text` is one synchronous HTTP command per paragraph.
+
+    Returns:
+        tuple: (list of stripped paragraph strings, minimum length the
+        caller should require). The threshold is lower when a known main
+        content container matched, because those paragraphs are already
+        scoped to the article body.
+    """
+    page_source = driver.page_source
+    if page_source:
+        return _paragraph_texts_from_html(page_source)
+
+    # page_source can come back empty for pages that render entirely from
+    # script; fall back to live elements, reading all paragraph texts in
+    # one script call rather than one `.text` RPC per paragraph.
+    containers = driver.find_elements(By.CSS_SELECTOR, MAIN_CONTAINER_COMBINED_SELECTOR)
+    if containers:
+        return driver.execute_script(
+            "return Array.from(arguments[0].querySelectorAll('p')).map(p => (p.innerText || '').trim());",
+            containers[0],
+        ), 20
+    logger.warning("Main content block not found, using all <p> tags as fallback")
+    return driver.execute_script(
+        "return Array.from(document.getElementsByTagName('p')).map(p => (p.innerText || '').trim());"
+    ), 50
+
+
+# Resource patterns the extractor never needs. Article pages only
+# contribute text to the PDF, yet ad-heavy news sites ship megabytes of
+# images, video and tracker scripts per page.
+BLOCKED_URL_PATTERNS = (
+    '*googletagmanager*',
+    '*doubleclick*',
+    '*googlesyndication*',
+    '*google_ads*',
+    '*adservice*',
+    '*onnetwork*',
+    '*reklama*',
+    '*facebook.net*',
+    '*scorecardresearch*',
+    '*.jpg',
+    '*.jpeg',
+    '*.png',
+    '*.webp',
+    '*.gif',
+    '*.mp4',
+    # Web fonts: text falls back to system fonts, which is fine for both
+    # extraction and the template-rendered PDFs. Stylesheets stay enabled
+    # so the direct print path keeps its layout.
+    '*.woff',
+    '*.woff2',
+    '*.ttf',
+    '*.otf',
+)
+
+
+def _block_unneeded_requests(driver: WebDriver) -> None:
+    """
+    Block media and tracker requests at the CDP network layer.
+
+    Installed before navigating to an article so the blocked resources are
+    never fetched at all, instead of being downloaded and discarded.
+    """
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logger.warning(f"Could not install network blocklist: {str(e)}")
+    try:
+        # Chrome's built-in heuristic blocker catches ad frames the URL
+        # patterns miss; best-effort since headless support varies.
+        driver.execute_cdp_cmd('Page.setAdBlockingEnabled', {'enabled': True})
+    except Exception:
+        pass
+
+
+def wait_stable(driver: WebDriver, quiet_ms: int = 300, timeout: float = 5.0) -> None:
+    """
+    Wait until the DOM stops mutating instead of sleeping a fixed interval.
+
+    A MutationObserver counts mutations; the page counts as settled once
+    the count holds steady for quiet_ms. Returns on timeout otherwise,
+    which matches the worst case of the fixed sleeps this replaces -
+    pages that settle early no longer pay the full interval.
+    """
+    try:
+        driver.execute_script(
+            "if (!window.__mutObserver) {"
+            "  window.__mutCount = 0;"
+            "  window.__mutObserver = new MutationObserver(m => window.__mutCount += m.length);"
+            "  window.__mutObserver.observe(document, {subtree: true, childList: true, attributes: true});"
+            "}"
+        )
+        deadline = time.monotonic() + timeout
+        last = driver.execute_script("return window.__mutCount || 0;")
+        quiet_since = time.monotonic()
+        while time.monotonic() < deadline:
+            time.sleep(0.1)
+            current = driver.execute_script("return window.__mutCount || 0;")
+            if current != last:
+                last = current
+                quiet_since = time.monotonic()
+            elif (time.monotonic() - quiet_since) * 1000 >= quiet_ms:
+                return
+    except Exception as e:
+        logger.debug(f"DOM-quiescence wait failed: {str(e)}")
+
+
+# A4 with the margins used for every generated article PDF.
+PDF_PRINT_OPTIONS = {
+    "printBackground": True,
+    "paperWidth": 8.27,      # A4 width in inches
+    "paperHeight": 11.69,    # A4 height in inches
+    "marginTop": 0.4,
+    "marginBottom": 0.4,
+    "marginLeft": 0.4,
+    "marginRight": 0.4,
+    "displayHeaderFooter": False,
+}
+
+
+def _print_to_pdf_stream(driver: WebDriver, output_path: str, options: dict = None) -> int:
+    """
+    Print the current page to PDF, streaming the data to disk.
+
+    Requesting the PDF with transferMode ReturnAsStream and copying it to
+    the file in 64 KiB IO.read chunks keeps peak memory flat; the default
+    ReturnAsBase64 transfer holds the whole base64 string plus the decoded
+    bytes in the worker at once. Falls back to the in-memory payload when
+    the browser does not return a stream handle.
+
+    Returns:
+        int: Number of bytes written
+    """
+    params = dict(options if options is not None else PDF_PRINT_OPTIONS)
+    params["transferMode"] = "ReturnAsStream"
+    result = driver.execute_cdp_cmd("Page.printToPDF", params)
+
+    stream_handle = result.get("stream")
+    if not stream_handle:
+        pdf_data = base64.b64decode(result["data"])
+        with open(output_path, 'wb') as f:
+            f.write(pdf_data)
+        return len(pdf_data)
+
+    written = 0
+    try:
+        with open(output_path, 'wb') as f:
+            while True:
+                chunk = driver.execute_cdp_cmd("IO.read", {"handle": stream_handle, "size": 65536})
+                data = chunk.get("data")
+                if data:
+                    payload = base64.b64decode(data) if chunk.get("base64Encoded") else data.encode()
+                    f.write(payload)
+                    written += len(payload)
+                if chunk.get("eof"):
+                    break
+    finally:
+        try:
+            driver.execute_cdp_cmd("IO.close", {"handle": stream_handle})
+        except Exception:
+            pass
+    return written
+
+
+def _extract_article_from_html(page_source: str) -> dict:
+    """
+    Run the title/author/content selector chains over an HTML string.
+
+    The in-browser equivalent computes innerText, which forces browser
+    layout for every candidate selector; lxml's text_content() walks the
+    parsed tree in C with no layout at all, and the whole extraction
+    costs only the single page_source fetch.
+    """
+    doc = lxml.html.fromstring(page_source)
+    lxml.etree.strip_elements(doc, 'script', 'style', 'iframe', with_tail=False)
+    for bad in doc.cssselect(UNWANTED_NODE_SELECTOR):
+        parent = bad.getparent()
+        if parent is not None:
+            parent.remove(bad)
+
+    title = ''
+    for selector in TITLE_SELECTORS:
+        for el in doc.cssselect(selector):
+            title = el.text_content().strip()
+            if title:
+                break
+        if title:
+            break
+
+    author = ''
+    for selector in AUTHOR_SELECTORS:
+        for el in doc.cssselect(selector):
+            if el.tag == 'meta':
+                author = (el.get('content') or '').strip()
+            else:
+                author = el.text_content().strip()
+            if author:
+                break
+        if author:
+            break
+
+    content_parts = []
+    for selector in CONTENT_SELECTORS:
+        for el in doc.cssselect(selector):
+            text = el.text_content().strip()
+            if len(text) > 100:
+                content_parts.append(text)
+    if not content_parts:
+        # Fallback: all paragraph text on the page
+        for p in doc.cssselect('article p, .article-content p, [class*="content"] p'):
+            text = p.text_content().strip()
+            if text:
+                content_parts.append(text)
+
+    return {'title': title, 'author': author, 'content_parts': content_parts}
+
 
 def extract_article_content(driver: WebDriver) -> dict:
     """
     Extract article title, author, and clean text content from the current page.
-    
+
+    One page_source fetch parsed with lxml covers the whole extraction;
+    every find_element/`.text` pair would otherwise be a separate
+    synchronous HTTP round-trip to the WebDriver. Pages whose
+    page_source comes back empty fall back to the single in-browser
+    extraction script.
+
     Args:
         driver: Selenium WebDriver instance
-    
+
     Returns:
         dict: Dictionary with 'title', 'author', and 'content' keys
     """
     try:
-        # Extract title - try multiple selectors
-        title = ""
-        title_selectors = [
-            'h1',
-            '.content-part__top h1',
-            'article h1',
-            '[class*="content-part"] h1',
-            '.article-title',
-            'h1.article-title',
-        ]
-        
-        for selector in title_selectors:
-            try:
-                title_elem = driver.find_element(By.CSS_SELECTOR, selector)
-                title = title_elem.text.strip()
-                if title:
-                    logger.info(f"Found title with selector: {selector}")
-                    break
-            except NoSuchElementException:
-                continue
-        
+        page_source = driver.page_source
+        if page_source:
+            data = _extract_article_from_html(page_source)
+        else:
+            data = driver.execute_script(
+                EXTRACT_ARTICLE_JS, TITLE_SELECTORS, AUTHOR_SELECTORS, CONTENT_SELECTORS
+            )
+
+        title = data.get('title') or ''
         if not title:
             logger.warning("Could not find article title")
-        
-        # Extract author - try multiple selectors
-        author = ""
-        author_selectors = [
-            '[class*="author"]',
-            '[class*="content-part__author"]',
-            '.article-author',
-            '[itemprop="author"]',
-            'meta[property="article:author"]',
-        ]
-        
-        for selector in author_selectors:
-            try:
-                if selector.startswith('meta'):
-                    author_elem = driver.find_element(By.CSS_SELECTOR, selector)
-                    author = author_elem.get_attribute('content') or ""
-                else:
-                    author_elem = driver.find_element(By.CSS_SELECTOR, selector)
-                    author = author_elem.text.strip()
-                if author:
-                    logger.info(f"Found author with selector: {selector}")
-                    break
-            except NoSuchElementException:
-                continue
-        
+
+        author = data.get('author') or ''
         if not author:
             logger.info("Could not find article author, using default")
             author = "Radio ZET"
-        
-        # Extract main article content - look for the specific sections
-        content = ""
-        content_selectors = [
-            '.full-width-depends-on-screening__container.content-part__top',
-            '.full-width-depends-on-screening__container.full-content__main',
-            'section.content-part__top__left',
-            'section.full-content__main__left',
-            'article',
-            '[class*="content-part"]',
-            '[class*="full-content"]',
-        ]
-        
-        # Try to get content from the main article sections
-        content_parts = []
-        for selector in content_selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                for elem in elements:
-                    # Get text content, excluding ads and unwanted elements
-                    text = driver.execute_script("""
-                        const el = arguments[0];
-                        // Clone to avoid modifying original
-                        const clone = el.cloneNode(true);
-                        
-                        // Remove unwanted elements from clone
-                        const unwanted = clone.querySelectorAll(`
-                            [class*="reklama"],
-                            [id*="reklama"],
-                            [class*="advertisement"],
-                            [id*="google_ads"],
-                            [class*="onnetwork"],
-                            [data-adv-display-type],
-                            [class*="share"],
-                            [class*="reaction"],
-                            [class*="recommended"],
-                            [class*="related"],
-                            [class*="stories"],
-                            [class*="radio-program"],
-                            [class*="content-part__tags"],
-                            iframe,
-                            [class*="advert"]
-                        `);
-                        unwanted.forEach(item => item.remove());
-                        
-                        // Get clean text
-                        return clone.innerText || clone.textContent || '';
-                    """, elem)
-                    
-                    if text and len(text.strip()) > 100:  # Only add if substantial content
-                        content_parts.append(text.strip())
-                        logger.info(f"Found content section with selector: {selector}, length: {len(text)}")
-            except Exception as e:
-                logger.debug(f"Error extracting content with selector {selector}: {str(e)}")
-                continue
-        
-        # Combine all content parts
-        if content_parts:
-            content = "\n\n".join(content_parts)
-        else:
-            # Fallback: get all paragraph text
-            try:
-                paragraphs = driver.find_elements(By.CSS_SELECTOR, 'article p, .article-content p, [class*="content"] p')
-                content = "\n\n".join([p.text.strip() for p in paragraphs if p.text.strip()])
-            except Exception as e:
-                logger.warning(f"Could not extract article content: {str(e)}")
-        
+
+        content = "\n\n".join(data.get('content_parts') or [])
         if not content or len(content.strip()) < 200:
             logger.warning(f"Extracted content seems too short: {len(content) if content else 0} chars")
-        
+
         return {
             'title': title,
             'author': author,
             'content': content
         }
-        
+
     except Exception as e:
         logger.error(f"Error extracting article content: {str(e)}")
         return {
@@ -169,41 +654,24 @@ def extract_article_content(driver: WebDriver) -> dict:
         }
 
 
-def create_clean_html(title: str, author: str, content: str) -> str:
-    """
-    Create a clean HTML structure with minimal CSS for reading.
-    
-    Args:
-        title: Article title
-        author: Article author
-        content: Article content text
-    
-    Returns:
-        str: Clean HTML string
-    """
-    # Escape HTML entities
-    import html
-    title_escaped = html.escape(title)
-    author_escaped = html.escape(author)
-    
-    # Convert content to paragraphs (split by double newlines)
-    content_paragraphs = content.split('\n\n')
-    content_html = '\n'.join([f'<p>{html.escape(p.strip())}</p>' for p in content_paragraphs if p.strip()])
-    
-    clean_html = f"""
+# The static markup and CSS of the generated pages live in module-level
+# templates: an f-string would re-parse the ~3 KB CSS block (with all the
+# {{ }} doubling) on every article, while Template.substitute only touches
+# the placeholders.
+CLEAN_HTML_TEMPLATE = string.Template("""
     <!DOCTYPE html>
     <html lang="pl">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>{title_escaped}</title>
+        <title>${title}</title>
         <style>
-            * {{
+            * {
                 margin: 0;
                 padding: 0;
                 box-sizing: border-box;
-            }}
-            body {{
+            }
+            body {
                 font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', 'Fira Sans', 'Droid Sans', 'Helvetica Neue', sans-serif;
                 line-height: 1.6;
                 color: #333;
@@ -211,291 +679,105 @@ def create_clean_html(title: str, author: str, content: str) -> str:
                 padding: 40px 20px;
                 max-width: 800px;
                 margin: 0 auto;
-            }}
-            h1 {{
+            }
+            h1 {
                 font-size: 2em;
                 font-weight: 700;
                 margin-bottom: 20px;
                 color: #1a1a1a;
                 line-height: 1.2;
-            }}
-            .author {{
+            }
+            .author {
                 font-size: 0.9em;
                 color: #666;
                 margin-bottom: 30px;
                 font-style: italic;
-            }}
-            .content {{
+            }
+            .content {
                 font-size: 1.1em;
                 line-height: 1.8;
-            }}
-            .content p {{
+            }
+            .content p {
                 margin-bottom: 1.2em;
                 text-align: justify;
-            }}
-            .content p:last-child {{
+            }
+            .content p:last-child {
                 margin-bottom: 0;
-            }}
+            }
         </style>
     </head>
     <body>
-        <h1>{title_escaped}</h1>
-        <div class="author">{author_escaped}</div>
+        <h1>${title}</h1>
+        <div class="author">${author}</div>
         <div class="content">
-            {content_html}
+            ${body_html}
         </div>
     </body>
     </html>
-    """
-    return clean_html
+    """)
 
 
-def extract_and_save_pdf_nuclear_swap(driver: WebDriver, output_path: str, source_url: str = None) -> dict:
+def create_clean_html(title: str, author: str, content: str) -> str:
     """
-    Extract article content using Nuclear Swap method and save as PDF.
-    
-    This method:
-    1. Extracts text from <p> tags inside the main article container
-    2. Creates a clean HTML template with embedded CSS
-    3. Overwrites the entire page using document.write (Nuclear Swap)
-    4. Prints the clean page to PDF
-    
+    Create a clean HTML structure with minimal CSS for reading.
+
     Args:
-        driver: Selenium WebDriver instance
-        output_path: Full path where the PDF should be saved
-        source_url: Original article URL (optional, will use driver.current_url if not provided)
-    
+        title: Article title
+        author: Article author
+        content: Article content text
+
     Returns:
-        dict: Dictionary with 'title', 'author', and 'content' keys
+        str: Clean HTML string
     """
-    import html as html_escape
-    
-    try:
-        # 1. Extract data while still on the original site
-        # Save original URL before Nuclear Swap (must be done first!)
-        original_url = source_url if source_url else driver.current_url
-        
-        # Wait for page to load
-        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "h1")))
-        
-        # Extract title
-        title = ""
-        try:
-            title_elem = driver.find_element(By.TAG_NAME, "h1")
-            title = title_elem.text.strip()
-        except NoSuchElementException:
-            logger.warning("Could not find h1 tag, trying alternative selectors")
-            title_selectors = [
-                '.content-part__top h1',
-                'article h1',
-                '[class*="content-part"] h1',
-                '.article-title',
-            ]
-            for selector in title_selectors:
-                try:
-                    title_elem = driver.find_element(By.CSS_SELECTOR, selector)
-                    title = title_elem.text.strip()
-                    if title:
-                        break
-                except:
-                    continue
-        
-        if not title:
-            title = "Untitled Article"
-            logger.warning("Could not extract title, using default")
-        
-        # Extract author
-        author = "InfoSeek News"
-        author_selectors = [
-            ".author",
-            ".article-author",
-            "[class*='author']",
-            "[class*='content-part__author']",
-            "[itemprop='author']",
-        ]
-        
-        for selector in author_selectors:
-            try:
-                if selector.startswith('[') and 'itemprop' in selector:
-                    author_elem = driver.find_element(By.CSS_SELECTOR, selector)
-                    author = author_elem.get_attribute('content') or author_elem.text.strip()
-                else:
-                    author_elem = driver.find_element(By.CSS_SELECTOR, selector)
-                    author = author_elem.text.strip()
-                if author:
-                    logger.info(f"Found author: {author}")
-                    break
-            except:
-                continue
-        
-        # Extract publication date
-        publication_date = ""
-        date_selectors = [
-            "meta[property='article:published_time']",
-            "meta[name='article:published_time']",
-            "meta[property='og:published_time']",
-            "meta[name='datePublished']",
-            "meta[itemprop='datePublished']",
-            "time[datetime]",
-            "time[pubdate]",
-            "[class*='date']",
-            "[class*='published']",
-            "[class*='publication-date']",
-            "[class*='content-part__date']",
-        ]
-        
-        for selector in date_selectors:
-            try:
-                if selector.startswith('meta'):
-                    date_elem = driver.find_element(By.CSS_SELECTOR, selector)
-                    publication_date = date_elem.get_attribute('content') or date_elem.get_attribute('datetime')
-                elif selector.startswith('time'):
-                    date_elem = driver.find_element(By.CSS_SELECTOR, selector)
-                    publication_date = date_elem.get_attribute('datetime') or date_elem.text.strip()
-                else:
-                    date_elem = driver.find_element(By.CSS_SELECTOR, selector)
-                    publication_date = date_elem.text.strip()
-                
-                if publication_date:
-                    logger.info(f"Found publication date: {publication_date}")
-                    # Try to format the date
-                    try:
-                        from datetime import datetime
-                        # Check if it's a Unix timestamp (numeric string)
-                        if publication_date.isdigit() or (publication_date.replace('.', '').isdigit() and len(publication_date) <= 13):
-                            # Unix timestamp (seconds or milliseconds)
-                            timestamp = float(publication_date)
-                            if timestamp > 1e12:  # Milliseconds
-                                timestamp = timestamp / 1000
-                            dt = datetime.fromtimestamp(timestamp)
-                            publication_date = dt.strftime('%d.%m.%Y')
-                        # Try parsing ISO format
-                        elif 'T' in publication_date:
-                            dt = datetime.fromisoformat(publication_date.replace('Z', '+00:00'))
-                            publication_date = dt.strftime('%d.%m.%Y')
-                        elif len(publication_date) > 10:
-                            # Try other common formats
-                            for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d', '%d.%m.%Y', '%d/%m/%Y']:
-                                try:
-                                    dt = datetime.strptime(publication_date[:19], fmt)
-                                    publication_date = dt.strftime('%d.%m.%Y')
-                                    break
-                                except:
-                                    continue
-                    except Exception as e:
-                        logger.warning(f"Failed to parse date '{publication_date}': {str(e)}")
-                        # If parsing fails, try to use as is or set empty
-                        publication_date = ""
-                    if publication_date:
-                        break
-            except:
-                continue
-        
-        if not publication_date:
-            logger.info("Could not extract publication date")
-        
-        # Extract text content from <p> tags inside main article container
-        # Try multiple selectors to find the main content container
-        possible_content_selectors = [
-            "div.full-text",
-            "article",
-            "div.content",
-            "div#article-body",
-            ".full-width-depends-on-screening__container.full-content__main",
-            ".full-content__main",
-            "section.full-content__main__left",
-        ]
-        
-        content_paragraphs = []
-        main_block = None
-        
-        # Find the main content block
-        for selector in possible_content_selectors:
-            try:
-                main_block = driver.find_element(By.CSS_SELECTOR, selector)
-                logger.info(f"Found main content block with selector: {selector}")
-                break
-            except:
-                continue
-        
-        if main_block:
-            # Extract only <p> tags to avoid ads and scripts
-            paragraphs = main_block.find_elements(By.TAG_NAME, "p")
-            for p in paragraphs:
-                text = p.text.strip()
-                # Ignore very short paragraphs (likely photo captions, ads)
-                if len(text) > 20:
-                    # Filter out "Czerwony telefon Radia ZET" section and similar call-to-action text
-                    text_upper = text.upper()
-                    if not any(keyword in text_upper for keyword in [
-                        'CZERWONY TELEFON',
-                        'ZGŁOŚ SPRAWĘ',
-                        'BYŁEŚ ŚWIADKIEM',
-                        'MASZ TEMAT',
-                        'POWINNIŚMY SIĘ ZAJĄĆ'
-                    ]):
-                        content_paragraphs.append(text)
-        else:
-            # Fallback: get all <p> tags on the page
-            logger.warning("Main content block not found, using all <p> tags as fallback")
-            all_ps = driver.find_elements(By.TAG_NAME, "p")
-            for p in all_ps:
-                text = p.text.strip()
-                if len(text) > 50:
-                    # Filter out "Czerwony telefon" section
-                    text_upper = text.upper()
-                    if not any(keyword in text_upper for keyword in [
-                        'CZERWONY TELEFON',
-                        'ZGŁOŚ SPRAWĘ',
-                        'BYŁEŚ ŚWIADKIEM',
-                        'MASZ TEMAT',
-                        'POWINNIŚMY SIĘ ZAJĄĆ'
-                    ]):
-                        content_paragraphs.append(text)
-        
-        if not content_paragraphs:
-            logger.warning("No content paragraphs found")
-            content_paragraphs = ["Could not extract article content."]
-        
-        # Create clean HTML paragraphs
-        full_text_html = "".join([f"<p>{html_escape.escape(text)}</p>" for text in content_paragraphs])
-        
-        # 2. Create clean HTML template with embedded CSS
-        clean_html_template = f"""<!DOCTYPE html>
+    # Escape HTML entities
+    import html
+    title_escaped = html.escape(title)
+    author_escaped = html.escape(author)
+
+    # Convert content to paragraphs (split by double newlines)
+    content_paragraphs = content.split('\n\n')
+    content_html = '\n'.join([f'<p>{html.escape(p.strip())}</p>' for p in content_paragraphs if p.strip()])
+
+    return CLEAN_HTML_TEMPLATE.substitute(
+        title=title_escaped,
+        author=author_escaped,
+        body_html=content_html,
+    )
+
+
+# PDF layout for extract_and_save_pdf_nuclear_swap.
+PDF_HTML_TEMPLATE = string.Template("""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
-    <title>{html_escape.escape(title)}</title>
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Silkscreen:wght@400;700&display=swap" rel="stylesheet">
+    <title>${title}</title>
     <style>
-        @page {{ margin: 20mm; size: A4; }}
-        body {{
+        @page { margin: 20mm; size: A4; }
+        body {
             font-family: 'Georgia', 'Times New Roman', serif;
             line-height: 1.6;
             color: #333;
             max-width: 800px;
             margin: 0 auto;
             background-color: #fff;
-        }}
-        .header {{
+        }
+        .header {
             border-bottom: 2px solid #e74c3c;
             padding-bottom: 20px;
             margin-bottom: 30px;
-        }}
-        h1 {{
+        }
+        h1 {
             font-size: 28px;
             color: #2c3e50;
             margin: 0 0 10px 0;
             line-height: 1.3;
-        }}
-        .meta {{
+        }
+        .meta {
             font-size: 14px;
             color: #7f8c8d;
             font-style: italic;
-        }}
-        .meta a {{
+        }
+        .meta a {
             color: #5686fe;
             text-decoration: none;
             word-break: keep-all;
@@ -503,50 +785,52 @@ def extract_and_save_pdf_nuclear_swap(driver: WebDriver, output_path: str, sourc
             hyphens: none;
             -webkit-hyphens: none;
             -moz-hyphens: none;
-        }}
-        .meta a:hover {{
+        }
+        .meta a:hover {
             text-decoration: underline;
-        }}
-        @media print {{
-            .meta a {{
+        }
+        @media print {
+            .meta a {
                 color: #5686fe !important;
                 text-decoration: underline;
-            }}
-        }}
-        .content p {{
+            }
+        }
+        .content p {
             margin-bottom: 15px;
             font-size: 16px;
             text-align: justify;
-        }}
-        .footer {{
+        }
+        .footer {
             margin-top: 50px;
             text-align: center;
             border-top: 1px solid #eee;
             padding-top: 20px;
-        }}
-        .footer-text {{
+        }
+        .footer-text {
             font-size: 12px;
             color: #7f8c8d;
             margin-bottom: 8px;
-        }}
-        .footer-brand {{
-            font-family: 'Silkscreen', monospace;
+        }
+        .footer-brand {
+            /* No webfont: a remote stylesheet would block every PDF render
+               on DNS+TLS+fetch and fail entirely on offline workers. */
+            font-family: monospace;
             font-size: 24px;
             font-weight: 700;
             color: #5686fe;
             letter-spacing: -0.04em;
             line-height: 1.1;
-        }}
+        }
     </style>
 </head>
 <body>
     <div class="header">
-        <h1>{html_escape.escape(title)}</h1>
-        <div class="meta">Author: {html_escape.escape(author)}{f" | Date: {html_escape.escape(publication_date)}" if publication_date else ""} | Source: <a href="{html_escape.escape(original_url)}" target="_blank" rel="noopener noreferrer">{html_escape.escape(original_url)}</a></div>
+        <h1>${title}</h1>
+        <div class="meta">Author: ${author}${date_part} | Source: <a href="${source_url}" target="_blank" rel="noopener noreferrer">${source_url}</a></div>
     </div>
-    
+
     <div class="content">
-        {full_text_html}
+        ${body_html}
     </div>
 
     <div class="footer">
@@ -554,37 +838,140 @@ def extract_and_save_pdf_nuclear_swap(driver: WebDriver, output_path: str, sourc
         <div class="footer-brand">infoseek</div>
     </div>
 </body>
-</html>"""
+</html>""")
+
+
+def extract_and_save_pdf_nuclear_swap(driver: WebDriver, output_path: str, source_url: str = None) -> dict:
+    """
+    Extract article content using Nuclear Swap method and save as PDF.
+    
+    This method:
+    1. Extracts text from <p> tags inside the main article container
+    2. Creates a clean HTML template with embedded CSS
+    3. Overwrites the entire page using document.write (Nuclear Swap)
+    4. Prints the clean page to PDF
+    
+    Args:
+        driver: Selenium WebDriver instance
+        output_path: Full path where the PDF should be saved
+        source_url: Original article URL (optional, will use driver.current_url if not provided)
+    
+    Returns:
+        dict: Dictionary with 'title', 'author', and 'content' keys
+    """
+    import html as html_escape
+    
+    try:
+        # 1. Extract data while still on the original site
+        # Save original URL before Nuclear Swap (must be done first!)
+        original_url = source_url if source_url else driver.current_url
         
-        # 3. Nuclear Swap - completely replace the page
-        driver.execute_script("document.open(); document.write(arguments[0]); document.close();", clean_html_template)
+        # Wait for page to load
+        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "h1")))
+
+        # Title and author come from the shared single-round-trip script;
+        # content is harvested separately below, so no content selectors.
+        extracted = driver.execute_script(EXTRACT_ARTICLE_JS, TITLE_SELECTORS, AUTHOR_SELECTORS, [])
+
+        title = extracted.get('title') or ''
+        if not title:
+            title = "Untitled Article"
+            logger.warning("Could not extract title, using default")
+
+        author = extracted.get('author') or "InfoSeek News"
         
-        # Wait for browser to render the new clean HTML
-        time.sleep(1)
+        # Extract publication date. All meta tags come back as one dict in
+        # a single script call; the element probes below only run when no
+        # meta tag carried a usable date.
+        publication_date = ""
+        metas = driver.execute_script(META_CONTENT_JS) or {}
+        for key in DATE_META_KEYS:
+            raw_date = metas.get(key)
+            if raw_date:
+                logger.info(f"Found publication date: {raw_date}")
+                publication_date = _parse_publication_date(raw_date)
+                if publication_date:
+                    break
+
+        if not publication_date:
+            for selector in DATE_ELEMENT_SELECTORS:
+                try:
+                    date_elem = driver.find_element(By.CSS_SELECTOR, selector)
+                    if selector.startswith('time'):
+                        raw_date = date_elem.get_attribute('datetime') or date_elem.text.strip()
+                    else:
+                        raw_date = date_elem.text.strip()
+
+                    if raw_date:
+                        logger.info(f"Found publication date: {raw_date}")
+                        publication_date = _parse_publication_date(raw_date)
+                        if publication_date:
+                            break
+                except:
+                    continue
         
-        # 4. Print to PDF using CDP
-        pdf_data_result = driver.execute_cdp_cmd("Page.printToPDF", {
-            "printBackground": True,
-            "paperWidth": 8.27,      # A4 width in inches
-            "paperHeight": 11.69,    # A4 height in inches
-            "marginTop": 0.4,
-            "marginBottom": 0.4,
-            "marginLeft": 0.4,
-            "marginRight": 0.4,
-            "displayHeaderFooter": False
-        })
+        if not publication_date:
+            logger.info("Could not extract publication date")
         
-        # Decode base64 PDF data
-        pdf_data = base64.b64decode(pdf_data_result['data'])
+        # Extract text content from <p> tags inside the main article
+        # container. Parsing page_source with lxml is one WebDriver call
+        # total; reading `.text` per paragraph element would be one
+        # round-trip each.
+        content_paragraphs = []
+        paragraph_texts, min_paragraph_length = _harvest_paragraph_texts(driver)
+        for text in paragraph_texts:
+            # Ignore very short paragraphs (likely photo captions, ads)
+            if len(text) > min_paragraph_length:
+                # Filter out "Czerwony telefon Radia ZET" section and similar call-to-action text
+                if not UNWANTED_PARAGRAPH_RE.search(text):
+                    content_paragraphs.append(text)
         
-        # Ensure directory exists
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        if not content_paragraphs:
+            logger.warning("No content paragraphs found")
+            content_paragraphs = ["Could not extract article content."]
         
-        # Write PDF to file
-        with open(output_path, 'wb') as f:
-            f.write(pdf_data)
+        # Create clean HTML paragraphs: escape with one translate pass per
+        # paragraph and a single join, no intermediate list
+        full_text_html = "<p>" + "</p><p>".join(
+            text.translate(_HTML_ESCAPE) for text in content_paragraphs
+        ) + "</p>"
+        
+        # 2. Render the clean page from the module-level template
+        date_part = f" | Date: {html_escape.escape(publication_date)}" if publication_date else ""
+        clean_html_template = PDF_HTML_TEMPLATE.substitute(
+            title=html_escape.escape(title),
+            author=html_escape.escape(author),
+            date_part=date_part,
+            source_url=html_escape.escape(original_url),
+            body_html=full_text_html,
+        )
         
-        logger.info(f"PDF saved to {output_path}, size: {len(pdf_data)} bytes")
+        # Ensure directory exists
+        _ensure_dir(os.path.dirname(output_path))
+
+        if weasyprint is not None:
+            # 3. Render the PDF straight from the HTML string in the worker.
+            # The clean page is fully derived from already-extracted text, so
+            # sending it back through Chrome just to print it is a wasted
+            # browser render pass; this also frees the Selenium session for
+            # the next URL sooner.
+            weasyprint.HTML(string=clean_html_template).write_pdf(output_path)
+            pdf_size = os.path.getsize(output_path)
+        else:
+            # 3b. Fallback: Nuclear Swap via CDP. Page.setDocumentContent
+            # replaces the document synchronously, so no render wait is
+            # needed before printing.
+            frame_tree = driver.execute_cdp_cmd("Page.getFrameTree", {})
+            frame_id = frame_tree['frameTree']['frame']['id']
+            driver.execute_cdp_cmd("Page.setDocumentContent", {
+                "frameId": frame_id,
+                "html": clean_html_template,
+            })
+
+            # 4. Print to PDF using CDP, streaming the data to disk
+            pdf_size = _print_to_pdf_stream(driver, output_path)
+
+        logger.info(f"PDF saved to {output_path}, size: {pdf_size} bytes")
         
         # Return extracted data
         return {
@@ -599,22 +986,147 @@ def extract_and_save_pdf_nuclear_swap(driver: WebDriver, output_path: str, sourc
         raise
 
 
-def clean_page_for_pdf(driver: WebDriver) -> int:
+# Identify as a normal desktop browser for the no-browser fast path.
+STATIC_FETCH_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 '
+                  '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+}
+
+
+def _prevalidate_article_url(article_url: str) -> bool:
     """
-    Hide/remove unwanted elements (ads, navigation, footer) before saving PDF.
-    Keeps only the main article content.
-    
-    Args:
-        driver: Selenium WebDriver instance
-    
-    Returns:
-        int: Length of text content after cleaning (0 if error)
+    Probe a URL with a cheap HEAD before spending seconds scraping it.
+
+    A dead link or an off-site redirect is caught in ~50 ms here instead
+    of after a multi-second page render. Returns False only on a
+    definitively dead answer (404/410, non-HTML content type, or a
+    redirect landing outside the article URL shape). Anything
+    inconclusive — network errors, 405/501 from servers that reject
+    HEAD, 403 bot walls, 429 rate limits, 5xx — returns True so the
+    scrape paths still get their chance.
     """
-    # JavaScript to hide unwanted elements while preserving article content
-    hide_script = """
+    try:
+        head = requests.head(article_url, headers=STATIC_FETCH_HEADERS,
+                             allow_redirects=True, timeout=3)
+    except requests.RequestException:
+        return True
+    if head.status_code in (404, 410):
+        return False
+    if head.status_code != 200:
+        return True
+    content_type = head.headers.get('content-type', '').split(';')[0].strip()
+    if content_type and content_type != 'text/html':
+        return False
+    if head.url != article_url and not _is_valid_article_url(head.url):
+        return False
+    return True
+
+
+def _scrape_article_static(article_url: str, output_path: str):
+    """
+    Scrape a server-rendered article without a browser.
+
+    RadioZET articles arrive fully rendered in the initial HTML, so a
+    plain GET plus the lxml extraction chain and a WeasyPrint render
+    covers them in a few hundred milliseconds, compared to a multi-second
+    Chrome navigation. Returns the same dict as the nuclear-swap path, or
+    None when the page needs the full browser pipeline (fetch failure,
+    client-rendered content, or WeasyPrint unavailable).
+    """
+    import html as html_escape
+
+    if weasyprint is None:
+        return None
+    try:
+        response = requests.get(article_url, headers=STATIC_FETCH_HEADERS, timeout=10)
+    except requests.RequestException as e:
+        logger.debug(f"Static fetch failed for {article_url}: {str(e)}")
+        return None
+    if response.status_code != 200:
+        return None
+
+    page_source = response.text
+    if '<article' not in page_source and '"article"' not in page_source:
+        # Not recognizably a server-rendered article page
+        return None
+
+    try:
+        extracted = _extract_article_from_html(page_source)
+        title = extracted.get('title') or ''
+        if not title:
+            return None
+        author = extracted.get('author') or "InfoSeek News"
+
+        # Publication date straight from the meta tags in the fetched HTML
+        publication_date = ""
+        tree = lxml.html.fromstring(page_source)
+        for key in DATE_META_KEYS:
+            for meta in tree.cssselect(
+                f'meta[property="{key}"], meta[name="{key}"], meta[itemprop="{key}"]'
+            ):
+                raw_date = (meta.get('content') or '').strip()
+                if raw_date:
+                    publication_date = _parse_publication_date(raw_date)
+                    break
+            if publication_date:
+                break
+
+        paragraph_texts, min_paragraph_length = _paragraph_texts_from_html(page_source)
+        content_paragraphs = [
+            text for text in paragraph_texts
+            if len(text) > min_paragraph_length and not UNWANTED_PARAGRAPH_RE.search(text)
+        ]
+        if not content_paragraphs:
+            # Probably rendered client-side; let the browser path handle it
+            return None
+
+        full_text_html = "<p>" + "</p><p>".join(
+            text.translate(_HTML_ESCAPE) for text in content_paragraphs
+        ) + "</p>"
+
+        date_part = f" | Date: {html_escape.escape(publication_date)}" if publication_date else ""
+        clean_html = PDF_HTML_TEMPLATE.substitute(
+            title=html_escape.escape(title),
+            author=html_escape.escape(author),
+            date_part=date_part,
+            source_url=html_escape.escape(article_url),
+            body_html=full_text_html,
+        )
+
+        _ensure_dir(os.path.dirname(output_path))
+        weasyprint.HTML(string=clean_html).write_pdf(output_path)
+        logger.info(f"Static path saved {output_path}, size: {os.path.getsize(output_path)} bytes")
+
+        return {
+            'title': title,
+            'author': author,
+            'publication_date': publication_date,
+            'content': '\n\n'.join(content_paragraphs),
+        }
+    except Exception as e:
+        logger.debug(f"Static scrape failed for {article_url}: {str(e)}")
+        return None
+
+
+# JavaScript that hides unwanted elements while preserving article
+# content. Module-level so the source is built once; it runs through
+# script pinning, which uploads the multi-kilobyte body to a browser
+# session a single time and refers to it by key on later calls.
+CLEAN_PAGE_SCRIPT = """
     (function() {
         // Return value will be text length after cleaning
         let returnValue = 0;
+
+        // One injected rule plus classList.add replaces eight inline style
+        // writes per hidden element: the style engine invalidates once for
+        // the sheet instead of once per property per element.
+        const HIDDEN_CLASS = '__pdf-hidden';
+        if (!document.getElementById('__pdf-hidden-style')) {
+            const sheet = document.createElement('style');
+            sheet.id = '__pdf-hidden-style';
+            sheet.textContent = '.__pdf-hidden{display:none!important;visibility:hidden!important;height:0!important;width:0!important;opacity:0!important;overflow:hidden!important;position:absolute!important;left:-9999px!important;}';
+            document.head.appendChild(sheet);
+        }
         // Find the specific RadioZET sections to preserve:
         // 1. .full-width-depends-on-screening__container.content-part__top (header, title, lead, image)
         // 2. .full-width-depends-on-screening__container.full-content__main (main article body)
@@ -679,98 +1191,19 @@ def clean_page_for_pdf(driver: WebDriver) -> int:
                 wrapper.style.padding = '20px';
                 wrapper.style.backgroundColor = '#ffffff';
                 
-                // Clone sections deeply
+                // Clone sections deeply; the clones are stripped in one
+                // combined pass after the wrapper is assembled below
                 const topClone = topSection.cloneNode(true);
                 const mainClone = mainSection.cloneNode(true);
-                
-                // Clean up clones - remove ads and unwanted elements
-                const cleanElement = (el) => {
-                    if (!el) return;
-                    
-                    // Remove unwanted elements - be very thorough
-                    const unwantedSelectors = [
-                        '[class*="reklama"]',
-                        '[id*="reklama"]',
-                        '[class*="advertisement"]',
-                        '[id*="advertisement"]',
-                        '[id*="google_ads"]',
-                        '[id*="google-ads"]',
-                        '[class*="onnetwork"]',
-                        '[data-adv-display-type]',
-                        '[data-adv-display-replace]',
-                        '[data-adv-display-counter]',
-                        '[class*="share"]',
-                        '[class*="reaction"]',
-                        '[class*="zareaguj"]',
-                        '[class*="recommended"]',
-                        '[class*="related"]',
-                        '[class*="tu-sie-dzieje"]',
-                        '[class*="stories"]',
-                        '[class*="radio-program"]',
-                        '[class*="content-part__tags"]',
-                        '[class*="redphone"]',
-                        '[class*="embed-social"]',
-                        '[class*="embed"]',
-                        '[data-mrf-recirculation]',
-                        '.stories__block_onn',
-                        'iframe',
-                        '[class*="advert"]',
-                        '[id*="div-gpt-ad"]',
-                        '[class*="ad-container"]',
-                        '[class*="ad-wrapper"]',
-                        '[class*="ad-banner"]',
-                    ];
-                    
-                    unwantedSelectors.forEach(selector => {
-                        try {
-                            const unwanted = el.querySelectorAll(selector);
-                            unwanted.forEach(item => item.remove());
-                        } catch(e) {}
-                    });
-                    
-                    // Also remove elements by text content
-                    const allElements = Array.from(el.querySelectorAll('*'));
-                    allElements.forEach(item => {
-                        const text = (item.textContent || '').toUpperCase().trim();
-                        const classes = (item.className || '').toLowerCase();
-                        const id = (item.id || '').toLowerCase();
-                        const tagName = item.tagName.toLowerCase();
-                        
-                        // Remove if it's clearly unwanted
-                        if (text === 'TU SIĘ DZIEJE' ||
-                            text === 'GRAJ O KASĘ' ||
-                            text === 'REDAKCJA POLECA' ||
-                            text === 'ZOBACZ TAKŻE' ||
-                            text === 'WIĘCEJ NA TEMAT' ||
-                            text === 'TERAZ W RADIU ZET' ||
-                            text === 'TERAZ GRAMY' ||
-                            text === 'WŁĄCZ RADIO' ||
-                            text === 'POBIERZ APKĘ' ||
-                            (text.length < 50 && text.includes('REKLAMA')) ||
-                            classes.includes('stories__block_onn') ||
-                            classes.includes('radio-program-widget') ||
-                            id.includes('radio-program') ||
-                            (tagName === 'section' && (classes.includes('recommended') || classes.includes('related') || classes.includes('stories'))) ||
-                            (tagName === 'div' && (classes.includes('recommended') || classes.includes('related') || classes.includes('stories')))) {
-                            item.remove();
-                        }
-                    });
-                };
-                
-                cleanElement(topClone);
-                cleanElement(mainClone);
-                
-                // Clear body and add only our clean content
-                document.body.innerHTML = '';
-                document.body.style.margin = '0';
-                document.body.style.padding = '0';
-                document.body.style.backgroundColor = '#ffffff';
-                
-                // Add wrapper to body
-                document.body.appendChild(wrapper);
-                wrapper.appendChild(topClone);
-                wrapper.appendChild(mainClone);
-                
+
+                // Assemble the wrapper off-DOM, then swap it in with one
+                // atomic replaceChildren; innerHTML='' would serialize and
+                // tear down the whole old subtree before the reinsertion,
+                // paying two layout invalidations instead of one
+                wrapper.append(topClone, mainClone);
+                document.body.style.cssText += ';margin:0;padding:0;background-color:#ffffff;';
+                document.body.replaceChildren(wrapper);
+
                 mainContent = wrapper;
                 console.log('Created clean wrapper with both sections');
             } else if (topSection) {
@@ -785,18 +1218,9 @@ def clean_page_for_pdf(driver: WebDriver) -> int:
                 wrapper.style.backgroundColor = '#ffffff';
                 
                 const topClone = topSection.cloneNode(true);
-                const cleanElement = (el) => {
-                    const unwanted = el.querySelectorAll('[class*="reklama"], [id*="reklama"], [class*="advertisement"], [id*="google_ads"], [class*="onnetwork"], [data-adv-display-type], [class*="share"], [class*="reaction"], [class*="recommended"], [class*="related"], [class*="stories"], iframe, [class*="advert"]');
-                    unwanted.forEach(item => item.remove());
-                };
-                cleanElement(topClone);
-                
-                document.body.innerHTML = '';
-                document.body.style.margin = '0';
-                document.body.style.padding = '0';
-                document.body.style.backgroundColor = '#ffffff';
-                document.body.appendChild(wrapper);
-                wrapper.appendChild(topClone);
+                wrapper.append(topClone);
+                document.body.style.cssText += ';margin:0;padding:0;background-color:#ffffff;';
+                document.body.replaceChildren(wrapper);
                 mainContent = wrapper;
                 console.log('Using only top section');
             } else if (mainSection) {
@@ -811,25 +1235,55 @@ def clean_page_for_pdf(driver: WebDriver) -> int:
                 wrapper.style.backgroundColor = '#ffffff';
                 
                 const mainClone = mainSection.cloneNode(true);
-                const cleanElement = (el) => {
-                    const unwanted = el.querySelectorAll('[class*="reklama"], [id*="reklama"], [class*="advertisement"], [id*="google_ads"], [class*="onnetwork"], [data-adv-display-type], [class*="share"], [class*="reaction"], [class*="recommended"], [class*="related"], [class*="stories"], iframe, [class*="advert"]');
-                    unwanted.forEach(item => item.remove());
-                };
-                cleanElement(mainClone);
-                
-                document.body.innerHTML = '';
-                document.body.style.margin = '0';
-                document.body.style.padding = '0';
-                document.body.style.backgroundColor = '#ffffff';
-                document.body.appendChild(wrapper);
-                wrapper.appendChild(mainClone);
+                wrapper.append(mainClone);
+                document.body.style.cssText += ';margin:0;padding:0;background-color:#ffffff;';
+                document.body.replaceChildren(wrapper);
                 mainContent = wrapper;
                 console.log('Using only main section');
             }
         } catch(e) {
             console.log('Error finding specific sections:', e);
         }
-        
+
+        // Strip ads and widgets from the assembled wrapper in a single
+        // combined selector pass plus one text scan, instead of running
+        // the same cleanElement sweeps separately on each clone. Removed
+        // nodes also drop out of every later traversal, unlike hidden ones.
+        if (mainContent) {
+            try {
+                const CLONE_STRIP_SEL = [
+                    '[class*="reklama"]', '[id*="reklama"]',
+                    '[class*="advertisement"]', '[id*="advertisement"]',
+                    '[id*="google_ads"]', '[id*="google-ads"]', '[class*="onnetwork"]',
+                    '[data-adv-display-type]', '[data-adv-display-replace]', '[data-adv-display-counter]',
+                    '[class*="share"]', '[class*="reaction"]', '[class*="zareaguj"]',
+                    '[class*="recommended"]', '[class*="related"]', '[class*="tu-sie-dzieje"]',
+                    '[class*="stories"]', '[class*="radio-program"]',
+                    '[class*="content-part__tags"]', '[class*="redphone"]',
+                    '[class*="embed-social"]', '[class*="embed"]',
+                    '[data-mrf-recirculation]', '.stories__block_onn', 'iframe',
+                    '[class*="advert"]', '[id*="div-gpt-ad"]',
+                    '[class*="ad-container"]', '[class*="ad-wrapper"]', '[class*="ad-banner"]'
+                ].join(', ');
+                mainContent.querySelectorAll(CLONE_STRIP_SEL).forEach(el => el.remove());
+
+                // Widget headings survive the selector pass only as plain
+                // text labels; checking childless leaves keeps this from
+                // re-serializing textContent for whole subtrees
+                const WIDGET_LABELS = ['TU SIĘ DZIEJE', 'GRAJ O KASĘ', 'REDAKCJA POLECA',
+                                       'ZOBACZ TAKŻE', 'WIĘCEJ NA TEMAT', 'TERAZ W RADIU ZET',
+                                       'TERAZ GRAMY', 'WŁĄCZ RADIO', 'POBIERZ APKĘ'];
+                Array.from(mainContent.getElementsByTagName('*')).forEach(item => {
+                    if (item.children.length !== 0) return;
+                    const text = (item.textContent || '').toUpperCase().trim();
+                    if (WIDGET_LABELS.includes(text) ||
+                        (text.length < 50 && text.includes('REKLAMA'))) {
+                        item.remove();
+                    }
+                });
+            } catch(e) {}
+        }
+
         // If still no content found, use body as fallback
         if (!mainContent) {
             mainContent = document.body;
@@ -840,403 +1294,250 @@ def clean_page_for_pdf(driver: WebDriver) -> int:
         // The body now contains only our clean wrapper with article content
         // No need to hide anything else - body has been completely replaced
         
-        // Hide "TU SIĘ DZIEJE", related content, social buttons, reactions, etc.
-        // Hide these even if they're inside main content - they're not part of the article
-        try {
-            const unwantedSelectors = [
+        // Fast path for the one site currently scraped: when the
+        // RadioZET section wrapper was built, the targeted strip above
+        // already removed everything unwanted, so the generic heuristic
+        // passes below are pure overhead. They still run for other
+        // domains and for pages where the known sections were missing.
+        const specialized = location.hostname.endsWith('radiozet.pl') &&
+                            mainContent !== document.body;
+        if (!specialized) {
+            // One combined traversal per rule set: the selectors formerly
+            // scanned in their own querySelectorAll sweeps are joined so the
+            // DOM is walked twice in total instead of once per selector.
+            const WIDGET_SEL = [
                 // Related/recommended content
-                '[class*="recommended"]',
-                '[class*="related"]',
-                '[class*="zareaguj"]',
-                '[class*="tu-sie-dzieje"]',
-                '[id*="recommended"]',
-                '[id*="related"]',
-                '.related-articles',
-                '.recommended-articles',
+                '[class*="recommended"]', '[class*="related"]', '[class*="zareaguj"]',
+                '[class*="tu-sie-dzieje"]', '[id*="recommended"]', '[id*="related"]',
+                '.related-articles', '.recommended-articles',
                 // Social sharing and reactions
-                '[class*="share"]',
-                '[class*="reaction"]',
-                '[class*="content-part__share"]',
-                '[class*="content-part__reaction"]',
-                // Stories widget
-                '[class*="stories"]',
-                '[id*="stories"]',
-                // Radio program widget
-                '[class*="radio-program"]',
-                '[id*="radio-program"]',
-                // Tags section
-                '[class*="content-part__tags"]',
-                '[class*="tags"]',
-                // MRF recirculation (related articles)
-                '[data-mrf-recirculation]',
-                // Redphone section
-                '[class*="redphone"]',
-                // Embed social (Twitter, etc.)
-                '[class*="embed-social"]',
-                '[class*="embed"]',
-                // Stories block
-                '.stories__block_onn',
-            ];
-            
-            unwantedSelectors.forEach(selector => {
-                try {
-                    const unwantedElements = document.querySelectorAll(selector);
-                    unwantedElements.forEach(el => {
-                        // Hide even if in main content - these are not part of the article
-                        el.style.display = 'none';
-                        el.style.visibility = 'hidden';
-                        el.style.height = '0';
-                        el.style.width = '0';
-                        el.style.opacity = '0';
-                    });
-                } catch(e) {}
-            });
-        } catch(e) {}
-        
-        // Hide elements that contain "REKLAMA" text
-        try {
-            const allDivs = document.querySelectorAll('div, section, aside');
-            allDivs.forEach(el => {
-                const text = (el.textContent || '').trim();
-                const innerHTML = (el.innerHTML || '').toUpperCase();
-                
-                // If element contains "REKLAMA" text, hide it
-                if (text.includes('REKLAMA') || innerHTML.includes('REKLAMA')) {
-                    // But check if it's not the main article content
-                    if (!mainContent || !mainContent.contains(el) || el === mainContent) {
-                        // Only hide if it's a small element or clearly an ad container
-                        const rect = el.getBoundingClientRect();
-                        if (rect.height < 1000 || text.length < 500) {
-                            el.style.display = 'none';
-                        }
-                    }
-                }
-            });
-        } catch(e) {}
-        
-        // Hide Google AdSense containers and iframes
-        try {
-            // Google AdSense specific selectors
-            const googleAdSelectors = [
-                '[id*="google_ads_iframe"]',
-                '[id*="google_ads"]',
-                '[id*="google-ads"]',
-                '[class*="google-ads"]',
-                '[class*="google_ads"]',
-                'div[id*="google_ads_iframe"]',
-                'div[id*="google_ads"]',
-            ];
-            
-            googleAdSelectors.forEach(selector => {
-                try {
-                    const adElements = document.querySelectorAll(selector);
-                    adElements.forEach(el => {
-                        // Hide all Google AdSense elements
-                        el.style.display = 'none';
-                        el.style.visibility = 'hidden';
-                        el.style.height = '0';
-                        el.style.width = '0';
-                        el.style.overflow = 'hidden';
-                    });
-                } catch(e) {}
-            });
-        } catch(e) {}
-        
-        // Hide onnetwork ad containers (RadioZET specific)
-        try {
-            const onnetworkSelectors = [
-                '.onnetwork-container',
-                '[class*="onnetwork"]',
-                '[data-adv-display-type]',
-                '[data-adv-display-replace]',
-                '[data-adv-display-counter]',
-            ];
-            
-            onnetworkSelectors.forEach(selector => {
-                try {
-                    const adElements = document.querySelectorAll(selector);
-                    adElements.forEach(el => {
-                        // Check if it's an ad container
-                        const hasAdvAttr = el.hasAttribute('data-adv-display-type') || 
-                                          el.hasAttribute('data-adv-display-replace');
-                        if (hasAdvAttr || el.className.includes('onnetwork')) {
-                            el.style.display = 'none';
-                            el.style.visibility = 'hidden';
-                            el.style.height = '0';
-                            el.style.width = '0';
-                            el.style.overflow = 'hidden';
-                        }
-                    });
-                } catch(e) {}
-            });
-        } catch(e) {}
-        
-        // Hide iframes that are clearly ads (but not inside main content)
-        try {
-            const iframes = document.querySelectorAll('iframe');
-            iframes.forEach(iframe => {
-                // Check if iframe is an ad
-                const parent = iframe.parentElement;
-                const isAdIframe = parent && (
-                    parent.id.includes('google_ads') ||
-                    parent.id.includes('ad') ||
-                    parent.className.includes('ad') ||
-                    parent.className.includes('reklama') ||
-                    parent.className.includes('onnetwork')
-                );
-                
-                if (isAdIframe || (!mainContent || !mainContent.contains(iframe))) {
-                    iframe.style.display = 'none';
-                    iframe.style.visibility = 'hidden';
-                }
-            });
-        } catch(e) {}
-        
-        // Hide ALL elements with "reklama" or "ad" in class/id
-        // But be careful not to hide main content
-        try {
-            const adSelectors = [
-                '[class*="reklama"]',
-                '[id*="reklama"]',
-                '[class*="advertisement"]',
-                '[id*="advertisement"]',
-                '[class*="REKLAMA"]',
-                '[id*="REKLAMA"]',
-                '[data-ad]',
-                '[data-advertisement]',
-            ];
-            
-            adSelectors.forEach(selector => {
-                try {
-                    const adElements = document.querySelectorAll(selector);
-                    adElements.forEach(el => {
-                        // Only hide if it's not the main content itself
-                        if (el !== mainContent && (!mainContent || !mainContent.contains(el))) {
-                            el.style.display = 'none';
-                            el.style.visibility = 'hidden';
-                            el.style.height = '0';
-                            el.style.width = '0';
-                            el.style.overflow = 'hidden';
-                        } else if (el !== mainContent && mainContent && mainContent.contains(el)) {
-                            // Even if inside main content, hide if it's clearly an ad
-                            const classes = (el.className || '').toLowerCase();
-                            const id = (el.id || '').toLowerCase();
-                            if (classes.includes('reklama') || id.includes('reklama') || 
-                                classes.includes('advertisement') || id.includes('advertisement')) {
-                                el.style.display = 'none';
-                                el.style.visibility = 'hidden';
-                            }
-                        }
-                    });
-                } catch(e) {}
-            });
-            
-            // Hide elements with "ad" in class/id, but be more careful
+                '[class*="share"]', '[class*="reaction"]',
+                '[class*="content-part__share"]', '[class*="content-part__reaction"]',
+                '[class*="social"]:not([class*="article"])',
+                // Stories and radio-program widgets
+                '[class*="stories"]', '[id*="stories"]', '.stories__block_onn',
+                '[class*="radio-program"]', '[id*="radio-program"]',
+                // Tags, recirculation, redphone, embeds
+                '[class*="content-part__tags"]', '[class*="tags"]',
+                '[data-mrf-recirculation]', '[class*="redphone"]',
+                '[class*="embed-social"]', '[class*="embed"]'
+            ].join(', ');
+
+            const AD_SEL = [
+                '[class*="reklama"]', '[id*="reklama"]',
+                '[class*="advertisement"]', '[id*="advertisement"]',
+                '[id*="google_ads_iframe"]', '[id*="google_ads"]', '[id*="google-ads"]',
+                '[class*="google-ads"]', '[class*="google_ads"]',
+                '.onnetwork-container', '[class*="onnetwork"]',
+                '[data-adv-display-type]', '[data-adv-display-replace]', '[data-adv-display-counter]',
+                '[data-ad]', '[data-advertisement]', '[id*="div-gpt-ad"]',
+                '[class*="ad-container"]', '[class*="ad-wrapper"]', '[class*="ad-banner"]',
+                'iframe'
+            ].join(', ');
+
+            const hide = (el) => el.classList.add(HIDDEN_CLASS);
+
             try {
-                const adElements = document.querySelectorAll('[class*="ad"]:not([class*="add"]):not([class*="advance"]):not([class*="admin"]), [id*="ad"]:not([id*="add"]):not([id*="advance"]):not([id*="admin"])');
-                adElements.forEach(el => {
-                    // Check if it's really an ad (not article content)
-                    const classes = (el.className || '').toLowerCase();
+                // Widgets, social buttons and related-content blocks are not
+                // part of the article even when they sit inside main content.
+                document.querySelectorAll(WIDGET_SEL).forEach(el => {
+                    if (el !== mainContent) hide(el);
+                });
+
+                document.querySelectorAll(AD_SEL).forEach(el => {
+                    if (el === mainContent) return;
+                    if (!mainContent || !mainContent.contains(el)) {
+                        hide(el);
+                        return;
+                    }
+                    // Inside the article, hide only explicit ad markers
+                    const classes = (typeof el.className === 'string' ? el.className : '').toLowerCase();
                     const id = (el.id || '').toLowerCase();
-                    const isAdContainer = classes.includes('ad-container') ||
-                                        classes.includes('ad-wrapper') ||
-                                        classes.includes('ad-banner') ||
-                                        id.includes('ad-container') ||
-                                        id.includes('ad-wrapper') ||
-                                        id.includes('ad-banner') ||
-                                        id.includes('google_ads');
-                    
-                    if (isAdContainer) {
-                        if (el !== mainContent && (!mainContent || !mainContent.contains(el))) {
-                            el.style.display = 'none';
-                            el.style.visibility = 'hidden';
-                        }
+                    if (classes.includes('reklama') || id.includes('reklama') ||
+                        classes.includes('advertisement') || id.includes('advertisement') ||
+                        classes.includes('onnetwork') || id.includes('google_ads') ||
+                        el.hasAttribute('data-adv-display-type') ||
+                        el.hasAttribute('data-adv-display-replace')) {
+                        hide(el);
                     }
                 });
             } catch(e) {}
-        } catch(e) {}
-        
-        // Hide elements with "REKLAMA" text content
-        try {
-            const allElements = document.querySelectorAll('*');
-            allElements.forEach(el => {
-                const text = (el.textContent || '').toUpperCase();
-                const classes = (el.className || '').toUpperCase();
-                const id = (el.id || '').toUpperCase();
-                
-                // Check if element is clearly an ad
-                if (text.includes('REKLAMA') || 
-                    classes.includes('REKLAMA') || 
-                    id.includes('REKLAMA') ||
-                    text.includes('ADVERTISEMENT') ||
-                    classes.includes('ADVERTISEMENT')) {
-                    el.style.display = 'none';
-                    el.style.visibility = 'hidden';
-                }
-            });
-        } catch(e) {}
-        
-        // Hide social sharing buttons outside article
-        try {
-            const shareButtons = document.querySelectorAll('[class*="share"], [class*="social"]:not([class*="article"])');
-            shareButtons.forEach(el => {
-                if (!mainContent || !mainContent.contains(el)) {
-                    el.style.display = 'none';
+
+            // Hide elements that contain "REKLAMA" text. Live getElementsBy*
+            // collections avoid the selector-matching cost of querySelectorAll,
+            // and scanning only container tags replaces the old full-page '*'
+            // sweep that matched every node.
+            try {
+                const scanReklama = (el) => {
+                    const text = (el.textContent || '').trim();
+                    const textUpper = text.toUpperCase();
+                    const classes = (typeof el.className === 'string' ? el.className : '').toUpperCase();
+                    const id = (el.id || '').toUpperCase();
+
+                    if (textUpper.includes('REKLAMA') || textUpper.includes('ADVERTISEMENT') ||
+                        classes.includes('REKLAMA') || classes.includes('ADVERTISEMENT') ||
+                        id.includes('REKLAMA')) {
+                        // But check if it's not the main article content
+                        if (!mainContent || !mainContent.contains(el) || el === mainContent) {
+                            // Only hide small elements or marked ad containers;
+                            // a text-length/class check instead of
+                            // getBoundingClientRect, which reads layout and
+                            // forces a reflow after any earlier style write
+                            if (text.length < 500 || classes.includes('REKLAMA') || id.includes('REKLAMA')) {
+                                el.classList.add(HIDDEN_CLASS);
+                            }
+                        }
+                    }
+                };
+                for (const tag of ['div', 'section', 'aside']) {
+                    for (const el of document.getElementsByTagName(tag)) {
+                        scanReklama(el);
+                    }
                 }
-            });
-        } catch(e) {}
+            } catch(e) {}
         
-        // Style main content for better PDF output
-        if (mainContent && mainContent !== document.body) {
-            // Ensure main content is visible
-            mainContent.style.display = 'block';
-            mainContent.style.visibility = 'visible';
-            mainContent.style.width = '100%';
-            mainContent.style.maxWidth = '900px';
-            mainContent.style.margin = '0 auto';
-            mainContent.style.padding = '20px';
-            mainContent.style.backgroundColor = '#ffffff';
+            // Style main content for better PDF output
+            if (mainContent && mainContent !== document.body) {
+                // Ensure main content is visible
+                mainContent.style.display = 'block';
+                mainContent.style.visibility = 'visible';
+                mainContent.style.width = '100%';
+                mainContent.style.maxWidth = '900px';
+                mainContent.style.margin = '0 auto';
+                mainContent.style.padding = '20px';
+                mainContent.style.backgroundColor = '#ffffff';
             
-            // Don't hide siblings - just hide specific ad containers
-            // This prevents accidentally hiding important content
-        }
-        
-        // Set clean background
-        document.body.style.background = '#ffffff';
-        document.body.style.padding = '0';
-        document.body.style.margin = '0';
+                // Don't hide siblings - just hide specific ad containers
+                // This prevents accidentally hiding important content
+            }
         
-        // Clean up inside main content - hide ads and unwanted elements
-        if (mainContent) {
-            const allElements = mainContent.querySelectorAll('*');
-            allElements.forEach(el => {
-                const classes = (el.className || '').toLowerCase();
-                const id = (el.id || '').toLowerCase();
-                const text = (el.textContent || '').toUpperCase().trim();
-                const tagName = el.tagName.toLowerCase();
-                
-                // Check if element is an ad - be very thorough
-                const isAd = classes.includes('reklama') || 
-                           classes.includes('advertisement') ||
-                           id.includes('reklama') ||
-                           id.includes('advertisement') ||
-                           id.includes('google_ads') ||
-                           id.includes('google-ads') ||
-                           classes.includes('onnetwork') ||
-                           el.hasAttribute('data-adv-display-type') ||
-                           el.hasAttribute('data-adv-display-replace') ||
-                           el.hasAttribute('data-adv-display-counter') ||
-                           // Check for ad containers
-                           (classes.includes('ad') && (classes.includes('container') || classes.includes('wrapper') || classes.includes('banner'))) ||
-                           (id.includes('ad') && (id.includes('container') || id.includes('wrapper') || id.includes('banner'))) ||
-                           // Check for div-gpt-ad (Google AdSense)
-                           (id.includes('div-gpt-ad') || classes.includes('div-gpt-ad')) ||
-                           // Check for advert containers
-                           (classes.includes('advert') && (classes.includes('container') || classes.includes('dfp'))) ||
-                           // Hide iframes that are ads
-                           (tagName === 'iframe' && (id.includes('google_ads') || id.includes('ad') || classes.includes('ad'))) ||
-                           // Hide elements with "REKLAMA" text (but only if small element)
-                           (text === 'REKLAMA' || (text.length < 50 && text.includes('REKLAMA')));
-                
-                // Hide social sharing buttons, reactions, and related content
-                const isUnwanted = classes.includes('share') ||
-                                 classes.includes('reaction') ||
-                                 classes.includes('zareaguj') ||
-                                 classes.includes('recommended') ||
-                                 classes.includes('related') ||
-                                 classes.includes('tu-sie-dzieje') ||
-                                 classes.includes('stories') ||
-                                 id.includes('recommended') ||
-                                 id.includes('related') ||
-                                 id.includes('mrf-recirculation') ||
-                                 // Hide radio program widget
-                                 (classes.includes('radio-program') || id.includes('radio-program')) ||
-                                 // Hide tags section
-                                 (classes.includes('content-part__tags')) ||
-                                 // Hide "Redakcja poleca" sections
-                                 (text.includes('REDAKCJA POLECA') || text.includes('WIĘCEJ NA TEMAT'));
-                
-                if (isAd || isUnwanted) {
-                    // Make sure ads and unwanted elements stay hidden
-                    el.style.display = 'none';
-                    el.style.visibility = 'hidden';
-                    el.style.height = '0';
-                    el.style.width = '0';
-                    el.style.opacity = '0';
-                    el.style.overflow = 'hidden';
-                    el.style.position = 'absolute';
-                    el.style.left = '-9999px';
-                } else {
-                    // Restore visibility for article content
-                    if (el.style.display === 'none' && !el.classList.contains('hidden')) {
-                        // But check if parent is hidden - if so, don't restore
-                        let parent = el.parentElement;
-                        let parentHidden = false;
-                        while (parent && parent !== mainContent) {
-                            if (parent.style.display === 'none') {
-                                parentHidden = true;
-                                break;
+            // Set clean background
+            document.body.style.background = '#ffffff';
+            document.body.style.padding = '0';
+            document.body.style.margin = '0';
+        
+            // Clean up inside main content - hide ads and unwanted elements.
+            // A pruning TreeWalker classifies the subtree without per-node
+            // selector matching. The traversal is split into a pure-read
+            // classification phase and a write phase: interleaving style
+            // writes with reads would invalidate layout on every write and
+            // force a synchronous reflow on the next read.
+            if (mainContent) {
+                // Precompiled alternations replace the ~25 includes() scans the
+                // loop used to run per node: one regex test over the combined
+                // class+id string classifies the element, and textContent - a
+                // full subtree serialization on container nodes - is only read
+                // for childless leaves, where it is a plain string fetch.
+                const AD_RE = /reklama|advertisement|google[_-]?ads|onnetwork|div-gpt-ad|ad[_-]?(?:container|wrapper|banner)|advert(?:container|dfp)?/;
+                const UNWANTED_RE = /share|reaction|zareaguj|recommended|related|tu-sie-dzieje|stories|radio-program|mrf-recirculation|content-part__tags/;
+                const IFRAME_AD_RE = /(?:^|[ _-])ad(?:$|[ _-])|ads/;
+                const toHide = [];
+                const toRestore = [];
+                // TreeWalker with FILTER_REJECT prunes whole subtrees: once a
+                // container is classified as an ad it is hidden along with
+                // everything inside it, so its descendants are never visited.
+                // This also guarantees every yielded node has no hidden
+                // ancestor, making the old per-node ancestor walk unnecessary.
+                const walker = document.createTreeWalker(mainContent, NodeFilter.SHOW_ELEMENT, {
+                    acceptNode(el) {
+                        // Hidden by an earlier pass - the subtree is settled
+                        if (el.classList.contains(HIDDEN_CLASS)) {
+                            return NodeFilter.FILTER_REJECT;
+                        }
+                        const classes = (typeof el.className === 'string' ? el.className : '').toLowerCase();
+                        const id = (el.id || '').toLowerCase();
+                        const attrs = classes + ' ' + id;
+                        const tagName = el.tagName.toLowerCase();
+
+                        // Check if element is an ad - be very thorough
+                        let isAd = AD_RE.test(attrs) ||
+                                   el.hasAttribute('data-adv-display-type') ||
+                                   el.hasAttribute('data-adv-display-replace') ||
+                                   el.hasAttribute('data-adv-display-counter') ||
+                                   // Hide iframes that are ads
+                                   (tagName === 'iframe' && IFRAME_AD_RE.test(attrs));
+
+                        // Hide social sharing buttons, reactions, and related content
+                        const isUnwanted = UNWANTED_RE.test(attrs);
+
+                        // Text heuristics ("REKLAMA" labels, "Redakcja poleca"
+                        // headings) only ever match small leaf elements
+                        if (!isAd && !isUnwanted && el.children.length === 0) {
+                            const text = (el.textContent || '').toUpperCase().trim();
+                            if (text === 'REKLAMA' ||
+                                (text.length < 50 && (text.includes('REKLAMA') ||
+                                                      text.includes('REDAKCJA POLECA') ||
+                                                      text.includes('WIĘCEJ NA TEMAT')))) {
+                                isAd = true;
                             }
-                            parent = parent.parentElement;
                         }
-                        if (!parentHidden) {
-                            el.style.display = '';
+
+                        if (isAd || isUnwanted) {
+                            toHide.push(el);
+                            return NodeFilter.FILTER_REJECT;
                         }
+
+                        // Subtrees the page itself hides deliberately stay as
+                        // they are; skipping them also keeps their descendants
+                        // out of the restore pass.
+                        if (el.style.display === 'none' && el.classList.contains('hidden')) {
+                            return NodeFilter.FILTER_REJECT;
+                        }
+                        return NodeFilter.FILTER_ACCEPT;
                     }
-                    if (el.style.visibility === 'hidden') {
-                        el.style.visibility = 'visible';
-                    }
-                    // Restore dimensions if they were set to 0
-                    if (el.style.height === '0px' || el.style.height === '0') {
-                        el.style.height = '';
-                    }
-                    if (el.style.width === '0px' || el.style.width === '0') {
-                        el.style.width = '';
+                });
+                while (walker.nextNode()) {
+                    const el = walker.currentNode;
+                    // Restore visibility for article content; the decision uses
+                    // only inline-style reads, no layout queries, and no hidden
+                    // ancestor is possible here thanks to the subtree pruning
+                    const restoreDisplay = el.style.display === 'none';
+                    const restoreVisibility = el.style.visibility === 'hidden';
+                    const restoreHeight = el.style.height === '0px' || el.style.height === '0';
+                    const restoreWidth = el.style.width === '0px' || el.style.width === '0';
+                    if (restoreDisplay || restoreVisibility || restoreHeight || restoreWidth) {
+                        toRestore.push([el, restoreDisplay, restoreVisibility, restoreHeight, restoreWidth]);
                     }
                 }
-            });
-            
-            // Ensure main content itself is visible
-            mainContent.style.display = 'block';
-            mainContent.style.visibility = 'visible';
-        }
+
+                // Write phase: one class toggle per hidden element; the
+                // injected stylesheet carries all eight hiding properties
+                toHide.forEach(el => el.classList.add(HIDDEN_CLASS));
+                toRestore.forEach(([el, restoreDisplay, restoreVisibility, restoreHeight, restoreWidth]) => {
+                    if (restoreDisplay) el.style.display = '';
+                    if (restoreVisibility) el.style.visibility = 'visible';
+                    if (restoreHeight) el.style.height = '';
+                    if (restoreWidth) el.style.width = '';
+                });
+
+                // Ensure main content itself is visible
+                mainContent.style.display = 'block';
+                mainContent.style.visibility = 'visible';
+            }
         
-        // Final pass - remove any remaining ad elements by text content
-        // But only if they're clearly ads, not article content
-        try {
-            const allRemaining = document.querySelectorAll('*');
-            allRemaining.forEach(el => {
-                // Skip if it's the main content
-                if (el === mainContent) return;
-                
-                const text = (el.textContent || '').toUpperCase().trim();
-                const classes = (el.className || '').toLowerCase();
-                const id = (el.id || '').toLowerCase();
-                
-                // Only hide if it's clearly an ad label/container
-                const isAdLabel = (text === 'REKLAMA' || 
-                                  (text.length < 20 && text.includes('REKLAMA'))) &&
-                                  el.children.length === 0;
-                
-                const isAdContainer = (classes.includes('reklama') || 
-                                      id.includes('reklama') ||
-                                      id.includes('google_ads') ||
-                                      classes.includes('onnetwork') ||
-                                      el.hasAttribute('data-adv-display-type'));
-                
-                if ((isAdLabel || isAdContainer) && (!mainContent || !mainContent.contains(el))) {
-                    el.style.display = 'none';
-                    el.style.visibility = 'hidden';
-                    el.style.height = '0';
-                    el.style.width = '0';
+            // Final pass - hide leftover childless "REKLAMA" labels outside the
+            // article. The container cases are already covered by the AD_SEL
+            // pass, so only the text-label check remains, over a live
+            // getElementsByTagName collection instead of querySelectorAll('*').
+            try {
+                for (const el of document.getElementsByTagName('*')) {
+                    if (el === mainContent || el.children.length !== 0) continue;
+
+                    const text = (el.textContent || '').toUpperCase().trim();
+                    const isAdLabel = text === 'REKLAMA' ||
+                                      (text.length < 20 && text.includes('REKLAMA'));
+
+                    if (isAdLabel && (!mainContent || !mainContent.contains(el))) {
+                        el.classList.add(HIDDEN_CLASS);
+                    }
                 }
-            });
-        } catch(e) {}
+            } catch(e) {}
+        }
         
-        // Verify content is not empty
-        const finalTextLength = mainContent ? (mainContent.textContent || '').trim().length : 0;
-        const finalInnerTextLength = mainContent ? (mainContent.innerText || '').trim().length : 0;
-        const actualLength = Math.max(finalTextLength, finalInnerTextLength);
+        // Verify content is not empty. textContent alone is enough for a
+        // length heuristic; innerText would force a full layout pass of
+        // the article subtree just to reproduce the rendered text.
+        const actualLength = mainContent ? (mainContent.textContent || '').length : 0;
         
         console.log('Page cleaning complete. Main content preserved. Text length:', actualLength);
         
@@ -1245,12 +1546,47 @@ def clean_page_for_pdf(driver: WebDriver) -> int:
         return returnValue;
         
     })();
+"""
+
+# Registered once per session via Page.addScriptToEvaluateOnNewDocument:
+# the function survives every navigation, so per-article cleanup becomes a
+# tiny named invocation instead of a source transfer. The lstrip matters:
+# a newline directly after `return` would trigger JS automatic semicolon
+# insertion and make the function return undefined.
+CLEAN_PAGE_INSTALL_SCRIPT = (
+    "window.__cleanForPDF = function() { return " + CLEAN_PAGE_SCRIPT.lstrip() + "};"
+)
+
+
+def clean_page_for_pdf(driver: WebDriver) -> int:
     """
+    Hide/remove unwanted elements (ads, navigation, footer) before saving PDF.
+    Keeps only the main article content.
     
+    Args:
+        driver: Selenium WebDriver instance
+    
+    Returns:
+        int: Length of text content after cleaning (0 if error)
+    """
     try:
-        content_length = driver.execute_script(hide_script)
-        time.sleep(2)  # Wait for changes to apply and content to render
-        
+        # The helper injected at session creation is present on every page;
+        # sessions that predate it (or lost the injection) get it installed
+        # now, so the full source crosses the wire at most once per page
+        # and the return value is a length either way.
+        content_length = driver.execute_script(
+            "return window.__cleanForPDF ? window.__cleanForPDF() : null;"
+        )
+        if content_length is None:
+            driver.execute_script(CLEAN_PAGE_INSTALL_SCRIPT)
+            content_length = driver.execute_script("return window.__cleanForPDF();")
+        # The style writes take effect on the next frame; awaiting one
+        # requestAnimationFrame replaces the old fixed two-second settle
+        driver.execute_async_script(
+            "const done = arguments[arguments.length - 1];"
+            "requestAnimationFrame(() => requestAnimationFrame(done));"
+        )
+
         if content_length and content_length < 200:
             logger.warning(f"Page cleaned but content seems short ({content_length} chars). May need adjustment.")
         else:
@@ -1262,37 +1598,101 @@ def clean_page_for_pdf(driver: WebDriver) -> int:
         return 0
 
 
+def _clean_html_for_pdf(page_source: str) -> str:
+    """
+    Strip ads and widgets from raw page HTML server-side.
+
+    lxml drops the unwanted nodes in C, so Chrome loads an already-clean
+    document instead of mutating the live DOM over CDP and sleeping while
+    the page settles.
+    """
+    doc = lxml.html.fromstring(page_source)
+    lxml.etree.strip_elements(doc, 'script', 'iframe', with_tail=False)
+    for bad in doc.cssselect(CLEAN_PAGE_NODE_SELECTOR):
+        bad.drop_tree()
+    return lxml.html.tostring(doc, encoding='unicode')
+
+
 def save_page_as_pdf(driver: WebDriver, output_path: str, clean_page: bool = True) -> None:
     """
     Save the current page as PDF using Chrome DevTools Protocol.
     Optionally cleans the page to show only article content.
-    
+
+    The preferred cleaning path strips the unwanted nodes from
+    page_source with lxml and reinstalls the clean document over CDP;
+    the in-browser hide script only runs when page_source is empty or
+    the server-side cleaning fails.
+
     Args:
         driver: Selenium WebDriver instance
         output_path: Full path where the PDF should be saved
         clean_page: If True, hide ads/navigation before saving
     """
     # Clean page before saving if requested
+    if clean_page:
+        cleaned_html = None
+        try:
+            page_source = driver.page_source
+            if page_source:
+                cleaned_html = _clean_html_for_pdf(page_source)
+        except Exception as e:
+            logger.warning(f"Server-side cleaning failed: {str(e)}, falling back to in-browser cleanup")
+
+        if cleaned_html:
+            # The grid browser does not share this filesystem, so the clean
+            # document is installed over CDP rather than via a temp file;
+            # setDocumentContent replaces the page synchronously.
+            frame_tree = driver.execute_cdp_cmd("Page.getFrameTree", {})
+            frame_id = frame_tree['frameTree']['frame']['id']
+            driver.execute_cdp_cmd("Page.setDocumentContent", {
+                "frameId": frame_id,
+                "html": cleaned_html,
+            })
+            clean_page = False
+
+    if clean_page:
+        try:
+            # Pages shipping a print stylesheet already hide nav and ads
+            # under @media print, which printToPDF honors - skip the whole
+            # in-browser cleanup for them.
+            has_print_css = driver.execute_script("""
+                return Array.from(document.styleSheets).some(s => {
+                    try {
+                        return Array.from(s.cssRules || []).some(r => r.media && r.media.mediaText.includes('print'));
+                    } catch(e) {
+                        return false;
+                    }
+                });
+            """)
+            if has_print_css:
+                logger.info("Page has a print stylesheet, relying on native print-media handling")
+                clean_page = False
+        except Exception:
+            pass
+
     if clean_page:
         try:
             # First verify page has content before cleaning
             content_before = driver.execute_script("""
                 return (document.body.innerText || document.body.textContent || '').trim().length;
             """)
-            
+
             if content_before < 100:
                 logger.warning(f"Page has little content ({content_before} chars), skipping cleaning")
                 clean_page = False
             else:
                 content_after = clean_page_for_pdf(driver)
-                time.sleep(2)
-                
+                wait_stable(driver)
+
                 # Verify content is still there after cleaning
                 if not content_after or content_after < 200:
                     logger.warning(f"Content seems too short after cleaning ({content_after} chars), trying without cleaning")
                     # Reload page to restore original state
                     driver.refresh()
-                    time.sleep(3)
+                    WebDriverWait(driver, 10).until(
+                        lambda d: d.execute_script('return document.readyState') == 'complete'
+                    )
+                    wait_stable(driver)
                     clean_page = False
                 else:
                     logger.info(f"Content preserved: {content_before} -> {content_after} chars")
@@ -1311,43 +1711,371 @@ def save_page_as_pdf(driver: WebDriver, output_path: str, clean_page: bool = Tru
         'marginRight': 0.5,
     }
     
-    # Use execute_cdp_cmd for Chrome DevTools Protocol
-    result = driver.execute_cdp_cmd('Page.printToPDF', pdf_params)
-    
-    # Decode base64 PDF data
-    pdf_data = base64.b64decode(result['data'])
-    
     # Ensure directory exists
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    
-    # Write PDF to file
-    with open(output_path, 'wb') as f:
-        f.write(pdf_data)
-    
-    logger.info(f"PDF saved to {output_path}, size: {len(pdf_data)} bytes")
+    _ensure_dir(os.path.dirname(output_path))
+
+    # Stream the PDF to disk in chunks; the whole document never sits in
+    # memory as one base64 string plus its decoded copy
+    pdf_size = _print_to_pdf_stream(driver, output_path, pdf_params)
+
+    logger.info(f"PDF saved to {output_path}, size: {pdf_size} bytes")
+
+
+def _make_driver() -> WebDriver:
+    """
+    Create a remote headless Chrome session on the Selenium grid.
+
+    keep_alive reuses one TCP connection for all WebDriver commands
+    instead of reconnecting to the grid per command.
+    """
+    selenium_url = os.getenv('SELENIUM_URL', 'http://selenium:4444/wd/hub')
+
+    options = webdriver.ChromeOptions()
+    options.add_argument('--headless')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--window-size=1920,1080')
+    # The PDFs are built from extracted text, so images are dead weight;
+    # blocking them at the profile level catches what the CDP URL
+    # blocklist misses (inlined data, CDNs with odd extensions).
+    # Notification prompts would otherwise hang headless navigation.
+    options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2,
+    })
+    # Lazy loading defers ad-frame work into the post-load settle window
+    # we wait out; with it disabled the quiescence wait fires sooner.
+    options.add_argument('--disable-features=LazyFrameLoading,LazyImageLoading')
+
+    driver = webdriver.Remote(
+        command_executor=selenium_url,
+        options=options,
+        keep_alive=True
+    )
+    driver.set_page_load_timeout(30)
+    try:
+        # Make the cleanup script a named function on every future page
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument',
+                               {'source': CLEAN_PAGE_INSTALL_SCRIPT})
+    except Exception as e:
+        logger.debug(f"Could not pre-install cleanup script: {str(e)}")
+    return driver
+
+
+# Worker-local pool of warm browser sessions. Negotiating a new grid
+# session costs 1-3 s per task; returned sessions are reset and reused
+# instead. Sized to match the per-node session limit in docker-compose.
+_DRIVER_POOL_MAX = int(os.getenv('DRIVER_POOL_SIZE', '2'))
+_driver_pool: queue.Queue = queue.Queue(maxsize=_DRIVER_POOL_MAX)
+
+
+@worker_process_init.connect
+def _reset_driver_pool(**kwargs):
+    """
+    Drop sessions inherited through the prefork fork(); their sockets
+    belong to the parent process and must not be shared.
+    """
+    while True:
+        try:
+            _driver_pool.get_nowait()
+        except queue.Empty:
+            break
+
+
+@worker_process_shutdown.connect
+def _drain_driver_pool(**kwargs):
+    """Quit every pooled session so the grid slots are freed on shutdown."""
+    while True:
+        try:
+            driver = _driver_pool.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+
+@contextmanager
+def borrow_driver():
+    """
+    Check a browser session out of the worker-local pool.
+
+    Creates a fresh session when the pool is empty. On clean return the
+    session is reset (pinned scripts, cookies, about:blank) and pooled
+    for the next task; after a WebDriverException, or when the reset
+    itself fails, the session is quit and dropped instead so a broken
+    browser never gets reused.
+    """
+    try:
+        driver = _driver_pool.get_nowait()
+    except queue.Empty:
+        driver = _make_driver()
+    broken = False
+    try:
+        yield driver
+    except WebDriverException:
+        broken = True
+        raise
+    finally:
+        if not broken:
+            try:
+                driver.delete_all_cookies()
+                driver.get('about:blank')
+                _driver_pool.put_nowait(driver)
+                driver = None
+            except (WebDriverException, queue.Full):
+                pass
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+def _bump_progress(task_id: str):
+    """
+    Count one finished article on the task row.
+
+    An atomic F() update straight in the database, so concurrent article
+    tasks never race on a read-modify-write; pollers see the counter move
+    while the chord is still in flight.
+    """
+    SearchTask.objects.filter(pk=task_id).update(
+        articles_completed=F('articles_completed') + 1
+    )
+
+
+@shared_task(name='scrape_article_task')
+def scrape_article_task(task_id: str, article_url: str, article_title: str, idx: int,
+                        force_rescrape: bool = False):
+    """
+    Scrape a single article and generate its PDF.
+
+    One article per task lets Celery fan the batch out across workers
+    (and Selenium grid sessions) instead of scraping sequentially in one
+    browser. A failed article fails only its own task slot.
+
+    Returns:
+        dict: Row data for SearchResult.bulk_from_scrape, or None if the
+        article could not be processed
+    """
+    # A cache hit skips the whole Selenium+PDF pipeline for this URL:
+    # reuse the PDF generated by the earlier run.
+    cache_key = _scrape_cache_key(article_url)
+    if not force_rescrape:
+        cached = cache.get(cache_key)
+        if cached and os.path.exists(os.path.join(settings.MEDIA_ROOT, cached['pdf_path'])):
+            logger.info(f"Article {idx} served from scrape cache: {article_url}")
+            _bump_progress(task_id)
+            return {
+                'title': cached['title'],
+                'url': article_url,
+                'path': cached['pdf_path'],
+            }
+
+    try:
+        # Kill dead links and off-site redirects before paying for a
+        # fetch or a page render
+        if not _prevalidate_article_url(article_url):
+            logger.info(f"Article {idx} failed URL pre-validation, skipping: {article_url}")
+            return None
+
+        # Fast path: server-rendered pages don't need a browser at all
+        pdf_filename = f"{task_id}_{idx}_{uuid.uuid4().hex[:8]}.pdf"
+        pdf_path = os.path.join(settings.MEDIA_ROOT, 'pdfs', pdf_filename)
+        article_data = _scrape_article_static(article_url, pdf_path)
+        if article_data:
+            logger.info(f"Article {idx} scraped without a browser: {article_url}")
+            pdf_relative_path = os.path.join('pdfs', pdf_filename)
+            cache.set(cache_key, {
+                'title': article_data['title'],
+                'author': article_data['author'],
+                'content': article_data['content'],
+                'pdf_path': pdf_relative_path,
+            }, SCRAPE_CACHE_TTL)
+            _bump_progress(task_id)
+            return {
+                'title': article_data['title'],
+                'url': article_url,
+                'path': pdf_relative_path,
+            }
+
+        with borrow_driver() as driver:
+            row = _scrape_article(driver, task_id, article_url, article_title, idx, cache_key)
+        _bump_progress(task_id)
+        return row
+    except Exception as e:
+        # Log error; the finalize callback drops None entries
+        logger.warning(f"Error processing article {idx} for task {task_id}: {str(e)}")
+        return None
+
+
+def _scrape_article(driver: WebDriver, task_id: str, article_url: str, article_title: str,
+                    idx: int, cache_key: str) -> dict:
+    """Navigate to one article on a borrowed session and produce its PDF."""
+    wait = WebDriverWait(driver, 15)
+
+    # Only the article text matters; never download the media and ads
+    _block_unneeded_requests(driver)
+
+    logger.info(f"Processing article {idx}: {article_title[:50]}... -> {article_url}")
+    driver.get(article_url)
+
+    # Wait for article to load
+    wait.until(EC.presence_of_element_located((By.TAG_NAME, 'body')))
+    wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
+    # Wait for dynamic content to finish rendering; returns as soon
+    # as the DOM goes quiet instead of idling a fixed three seconds
+    wait_stable(driver)
+
+    logger.info(f"Article {idx} loaded. Original URL: {article_url}, Current URL: {driver.current_url}")
+
+    # Generate unique filename for PDF
+    pdf_filename = f"{task_id}_{idx}_{uuid.uuid4().hex[:8]}.pdf"
+    pdf_path = os.path.join(settings.MEDIA_ROOT, 'pdfs', pdf_filename)
+
+    # Extract content and generate PDF using Nuclear Swap method.
+    # Always use the original URL we saved, not the current URL after load.
+    logger.info(f"Extracting content and generating PDF using Nuclear Swap method for: {article_title[:50]}...")
+    article_data = extract_and_save_pdf_nuclear_swap(driver, pdf_path, article_url)
+    logger.info(f"PDF generated with source URL: {article_url}")
+
+    # Get relative path for FileField
+    pdf_relative_path = os.path.join('pdfs', pdf_filename)
+
+    # Use extracted title if available, otherwise fallback to search result title
+    final_title = article_data.get('title', article_title) if article_data else article_title
+
+    cache.set(cache_key, {
+        'title': final_title,
+        'author': article_data.get('author', '') if article_data else '',
+        'content': article_data.get('content', '') if article_data else '',
+        'pdf_path': pdf_relative_path,
+    }, SCRAPE_CACHE_TTL)
+
+    return {
+        'title': final_title,
+        'url': article_url,
+        'path': pdf_relative_path,
+    }
+
+
+@shared_task(name='finalize_scrape_task')
+def finalize_scrape_task(items, task_id: str):
+    """
+    Chord callback: persist the scraped articles and close out the task.
+
+    Receives one result per scrape_article_task (None for failures),
+    writes the successful rows in one batched INSERT, and flips the
+    SearchTask status.
+    """
+    search_task = SearchTask.objects.get(id=task_id)
+    scraped_items = [item for item in items if item]
+
+    # Insert the rows and flip the status atomically: either the task is
+    # 'completed' with all its results visible, or neither happened. The
+    # queryset update() skips the model save path and its signals.
+    with transaction.atomic():
+        SearchResult.bulk_from_scrape(search_task, scraped_items)
+        SearchTask.objects.filter(pk=task_id).update(status='completed')
+    logger.info(f"Task {task_id} completed successfully with {len(scraped_items)} results")
+
+    return f"Task {task_id} completed successfully"
+
+
+# The JSON front-end of the same Google Programmable Search engine that
+# backs the on-site search widget the Selenium path scrapes.
+GOOGLE_CSE_ENDPOINT = 'https://www.googleapis.com/customsearch/v1'
+RADIOZET_SITEMAP_URL = 'https://wiadomosci.radiozet.pl/sitemap.xml'
+
+
+def _discover_urls(keyword: str, count: int) -> list:
+    """
+    Discover article URLs for a keyword without a browser.
+
+    Tries the Google Programmable Search JSON API first (one ~200 ms
+    request instead of rendering the search page, clicking through the
+    cookie banner and scraping .gsc-webResult links), then falls back to
+    the news sitemap filtered by the keyword to top the list up. Returns
+    a list of (url, title) tuples; fewer than count entries sends the
+    caller down the Selenium discovery path, since the rendered full-text
+    search casts a wider net than either HTTP source.
+    """
+    articles = []
+    seen_urls = set()
+
+    def _collect(url, title):
+        if url in seen_urls or not _is_valid_article_url(url):
+            return
+        seen_urls.add(url)
+        articles.append((url, title or f"Article {len(articles) + 1}"))
+
+    api_key = os.getenv('GOOGLE_CSE_API_KEY', '')
+    cse_cx = os.getenv('GOOGLE_CSE_CX', '')
+    if api_key and cse_cx:
+        try:
+            response = requests.get(GOOGLE_CSE_ENDPOINT, params={
+                'key': api_key,
+                'cx': cse_cx,
+                'q': keyword,
+                'num': 10,
+            }, timeout=10)
+            if response.status_code == 200:
+                for item in response.json().get('items', []):
+                    _collect(item.get('link', ''), (item.get('title') or '').strip())
+                    if len(articles) >= count:
+                        return articles[:count]
+        except (requests.RequestException, ValueError) as e:
+            logger.debug(f"CSE API discovery failed for '{keyword}': {str(e)}")
+
+    # Sitemap: recent articles with keyword tokens in the slug or the
+    # <news:title> entry; tops up a short CSE answer (seen_urls dedupes)
+    keyword_tokens = [token for token in keyword.lower().split() if token]
+    if keyword_tokens:
+        try:
+            response = requests.get(RADIOZET_SITEMAP_URL,
+                                    headers=STATIC_FETCH_HEADERS, timeout=10)
+            if response.status_code == 200:
+                tree = lxml.etree.fromstring(response.content)
+                for url_node in tree.iter('{*}url'):
+                    loc = url_node.findtext('{*}loc', '')
+                    title = url_node.findtext('{*}news/{*}title', '').strip()
+                    haystack = f"{loc.lower()} {title.lower()}"
+                    if any(token in haystack for token in keyword_tokens):
+                        _collect(loc.strip(), title)
+                        if len(articles) >= count:
+                            break
+        except (requests.RequestException, lxml.etree.XMLSyntaxError) as e:
+            logger.debug(f"Sitemap discovery failed for '{keyword}': {str(e)}")
+
+    return articles[:count]
 
 
 @shared_task(name='scrape_news_task')
-def scrape_news_task(task_id: str, keyword: str, article_count: int = 3):
+def scrape_news_task(task_id: str, keyword: str, article_count: int = 3, force_rescrape: bool = False):
     """
     Celery task to scrape news based on a SearchTask keyword.
-    
+
     Searches for news articles on RadioZET.pl (https://www.radiozet.pl)
-    
+
     Args:
         task_id: UUID string of the SearchTask to process
         keyword: Search keyword to use for scraping
         article_count: Number of articles to scrape (default: 3)
+        force_rescrape: Skip the per-URL scrape cache and re-process
+            every article even if it was scraped recently
         
     This task will:
     1. Update the SearchTask status to 'processing'
-    2. Connect to remote Selenium WebDriver
+    2. Borrow a WebDriver session from the worker pool
     3. Navigate to RadioZET.pl and search for keyword
     4. Extract first N article links (where N = article_count)
-    5. For each article: open, save as PDF, create SearchResult
-    6. Update the SearchTask status to 'completed' or 'failed'
+    5. Dispatch one scrape_article_task per article in a Celery chord
+    6. The finalize_scrape_task callback saves results and marks the
+       task 'completed' (or this task marks it 'failed' on setup errors)
     """
-    driver = None
     search_task = None
     
     try:
@@ -1358,288 +2086,170 @@ def scrape_news_task(task_id: str, keyword: str, article_count: int = 3):
             article_count = search_task.article_count
         logger.info(f"Starting scraping task {task_id} for keyword: {keyword}, article_count: {article_count}")
         
-        # Update status to processing
+        # Update status to processing and reset the progress counter for
+        # re-runs; a targeted UPDATE instead of a full-row save
         search_task.status = 'processing'
-        search_task.save()
-        
-        # Get Selenium URL from environment
-        selenium_url = os.getenv('SELENIUM_URL', 'http://selenium:4444/wd/hub')
-        
-        # Configure remote WebDriver options
-        options = webdriver.ChromeOptions()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--window-size=1920,1080')
-        
-        # Connect to remote Selenium WebDriver
-        driver = webdriver.Remote(
-            command_executor=selenium_url,
-            options=options
-        )
-        
-        # Set page load timeout
-        driver.set_page_load_timeout(30)
-        
-        # Navigate directly to search page on RadioZET.pl
-        # RadioZET uses URL-based search: /Wyszukaj?q=keyword
-        search_url = f'https://www.radiozet.pl/Wyszukaj?q={keyword}'
-        logger.info(f"Navigating to search page: {search_url}")
-        driver.get(search_url)
-        
-        # Wait for page to load completely
-        wait = WebDriverWait(driver, 15)
-        
-        # Wait for page to be ready
-        wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
-        
-        # Additional wait for dynamic content
-        time.sleep(2)
-        
-        # Handle cookie consent popup if present
-        # RadioZET uses OneTrust cookie consent
-        cookie_accept_selectors = [
-            (By.CSS_SELECTOR, 'button#onetrust-accept-btn-handler'),
-            (By.CSS_SELECTOR, 'button[class*="onetrust-accept"]'),
-            (By.CSS_SELECTOR, 'button[id*="accept"]'),
-            (By.CSS_SELECTOR, 'button:contains("AKCEPTUJĘ")'),
-            (By.CSS_SELECTOR, 'button:contains("Accept")'),
-            (By.XPATH, '//button[contains(text(), "AKCEPTUJĘ")]'),
-            (By.XPATH, '//button[contains(text(), "Accept")]'),
-        ]
-        
-        cookie_accepted = False
-        for by, selector in cookie_accept_selectors:
-            try:
-                cookie_button = wait.until(EC.element_to_be_clickable((by, selector)))
-                logger.info("Found cookie consent button, clicking...")
-                driver.execute_script("arguments[0].click();", cookie_button)
-                time.sleep(2)  # Wait for popup to disappear
-                cookie_accepted = True
-                logger.info("Cookie consent accepted")
-                break
-            except (TimeoutException, NoSuchElementException):
-                continue
-        
-        if not cookie_accepted:
-            logger.info("No cookie consent popup found or already accepted")
-        
-        # Wait for search results page to load
-        time.sleep(5)  # Wait for Google Custom Search to load
-        wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
-        
-        # Additional wait after cookie acceptance and for Google Custom Search to render
-        time.sleep(3)
-        
-        # RadioZET uses Google Custom Search - look for results in gsc-results
-        logger.info("Looking for Google Custom Search results...")
-        
-        # Wait for Google Custom Search results container
-        try:
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '.gsc-results, .gsc-webResult')))
-            logger.info("Google Custom Search results container found")
-        except TimeoutException:
-            logger.warning("Google Custom Search results container not found, trying alternative selectors")
-        
-        # Look for article links in Google Custom Search results
-        # Google Custom Search uses specific classes: .gsc-webResult, .gs-title, etc.
-        article_selectors = [
-            # Google Custom Search specific selectors
-            (By.CSS_SELECTOR, '.gsc-webResult .gs-title a'),
-            (By.CSS_SELECTOR, '.gsc-result .gs-title a'),
-            (By.CSS_SELECTOR, '.gsc-webResult a.gs-title'),
-            (By.CSS_SELECTOR, 'a.gs-title'),
-            (By.CSS_SELECTOR, '.gsc-results .gsc-webResult a'),
-            # Fallback selectors
-            (By.CSS_SELECTOR, '.gsc-webResult a[href*="radiozet.pl"]'),
-            (By.CSS_SELECTOR, '.gsc-result a[href*="/wiadomosci"]'),
-            (By.CSS_SELECTOR, '.gsc-result a[href*="/kultura"]'),
-        ]
-        
-        article_links = []
-        for by, selector in article_selectors:
-            try:
-                # Wait for at least one element to be present
-                wait.until(EC.presence_of_element_located((by, selector)))
-                time.sleep(2)  # Additional wait for dynamic content
-                elements = driver.find_elements(by, selector)
-                
-                # Filter out invalid links - only get actual article links, not category pages
-                valid_elements = []
-                for el in elements:
-                    href = el.get_attribute('href')
-                    if href and el.is_displayed():
-                        # Clean URL from Google tracking
-                        if 'url?q=' in href:
-                            parsed = urlparse(href)
-                            if 'q' in parse_qs(parsed.query):
-                                href = parse_qs(parsed.query)['q'][0]
-                        
-                        if href and 'radiozet.pl' in href:
-                            # Exclude category/section pages - these are usually short URLs
-                            # Category pages: /polityka, /biznes, /wiadomosci (without article path)
-                            # Article pages: /wiadomosci/kultura/article-title, /kultura/article-title, etc.
-                            
-                            # Split URL to check path depth
-                            url_parts = href.rstrip('/').split('/')
-                            
-                            # Skip if it's just a domain or category page (fewer than 5 parts)
-                            # Example: https://wiadomosci.radiozet.pl/polityka = 4 parts (domain + 1 path)
-                            # Example: https://wiadomosci.radiozet.pl/kultura/article = 5+ parts (domain + 2+ paths)
-                            if len(url_parts) >= 5:
-                                # Additional check: exclude if it ends with just a category name
-                                last_part = url_parts[-1]
-                                category_names = ['polityka', 'biznes', 'wiadomosci', 'sport', 'zdrowie', 'kultura', 'rozrywka']
-                                
-                                # If last part is a category name and URL is short, skip it
-                                if last_part in category_names and len(url_parts) <= 4:
-                                    continue
-                                
-                                # Include if it looks like an article (has more path segments or article-like structure)
-                                valid_elements.append(el)
-                                logger.debug(f"Valid article link found: {href}")
-                
-                if valid_elements:
-                    # Get first N unique article links (where N = article_count)
-                    seen_urls = set()
-                    for el in valid_elements:
-                        url = el.get_attribute('href')
-                        if url and url not in seen_urls:
-                            article_links.append(el)
-                            seen_urls.add(url)
-                            if len(article_links) >= article_count:
-                                break
-                    
-                    if article_links:
-                        logger.info(f"Found {len(article_links)} article links using selector: {selector}")
-                        break
-            except TimeoutException:
-                continue
+        search_task.articles_completed = 0
+        search_task.save(update_fields=['status', 'articles_completed'])
+
+        # Cheap HTTP discovery first: a single API or sitemap request
+        # replaces the rendered search-page flow — but only when it finds
+        # the full batch; a partial answer (the sitemap filter is much
+        # cruder than the search widget) falls back to the browser
+        articles = _discover_urls(keyword, article_count)
+        if len(articles) >= article_count:
+            logger.info(f"Discovered {len(articles)} article links without a browser")
+        else:
+            # Borrow a warm session from the worker pool instead of paying
+            # the 1-2 s Chrome cold start on every discovery run
+            with borrow_driver() as driver:
+                # The search results page carries the same ad/tracker payload as
+                # the articles; block it here too so discovery loads faster.
+                _block_unneeded_requests(driver)
+
+                # Navigate directly to search page on RadioZET.pl
+                # RadioZET uses URL-based search: /Wyszukaj?q=keyword
+                search_url = f'https://www.radiozet.pl/Wyszukaj?q={keyword}'
+                logger.info(f"Navigating to search page: {search_url}")
+                driver.get(search_url)
         
-        if not article_links:
-            logger.error("Could not find article links in Google Custom Search results")
-            raise NoSuchElementException("Could not find article links in search results")
+                # Wait for page to load completely; a 250 ms poll returns almost
+                # immediately once a condition holds instead of the default 500 ms
+                wait = WebDriverWait(driver, 15, poll_frequency=0.25)
         
-        # Process each article
-        for idx, link_element in enumerate(article_links[:article_count], 1):
-            try:
-                # Get article URL and title from Google Custom Search result
-                article_url = link_element.get_attribute('href')
-                
-                # Get title - in Google Custom Search, title is usually in the link text or parent element
-                article_title = link_element.text.strip()
-                if not article_title:
-                    # Try to get title from parent .gs-title element
-                    try:
-                        parent = link_element.find_element(By.XPATH, './..')
-                        article_title = parent.text.strip()
-                    except:
-                        article_title = link_element.get_attribute('title') or f"Article {idx}"
-                
-                if not article_url:
-                    logger.warning(f"Article {idx} has no URL, skipping")
-                    continue
-                
-                # Clean URL - remove Google tracking parameters
-                if 'url?q=' in article_url:
-                    # Extract actual URL from Google redirect
-                    parsed = urlparse(article_url)
-                    if 'q' in parse_qs(parsed.query):
-                        article_url = parse_qs(parsed.query)['q'][0]
-                        logger.debug(f"Extracted URL from Google redirect: {article_url}")
-                
-                # Remove any remaining tracking parameters (utm_*, ref, etc.)
-                if '?' in article_url:
-                    article_url = article_url.split('?')[0]
-                
-                # Ensure absolute URL
-                if not article_url.startswith('http'):
-                    # Handle relative URLs for RadioZET
-                    if article_url.startswith('/'):
-                        article_url = f"https://www.radiozet.pl{article_url}"
-                    else:
-                        article_url = f"https://www.radiozet.pl/{article_url}"
-                
-                # Final validation - make sure it's a real article URL
-                url_parts = article_url.rstrip('/').split('/')
-                if len(url_parts) < 5:
-                    logger.warning(f"Skipping short URL (likely category page): {article_url}")
-                    continue
-                
-                # Log the final cleaned URL
-                logger.debug(f"Final cleaned article URL: {article_url}")
-                
-                # Save the final cleaned URL before opening the page
-                final_article_url = article_url
-                logger.info(f"Processing article {idx}: {article_title[:50]}... -> {final_article_url}")
-                
-                # Open the article in a new tab
-                driver.execute_script("window.open(arguments[0], '_blank');", final_article_url)
-                driver.switch_to.window(driver.window_handles[-1])
-                
-                # Wait for article to load
-                wait.until(EC.presence_of_element_located((By.TAG_NAME, 'body')))
+                # Wait for page to be ready
                 wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
-                # Additional wait for content to fully render
-                time.sleep(3)
-                
-                # Log the actual URL after page load (for debugging)
-                actual_url_after_load = driver.current_url
-                logger.info(f"Article {idx} loaded. Original URL: {final_article_url}, Current URL: {actual_url_after_load}")
-                
-                # Generate unique filename for PDF
-                pdf_filename = f"{task_id}_{idx}_{uuid.uuid4().hex[:8]}.pdf"
-                pdf_path = os.path.join(settings.MEDIA_ROOT, 'pdfs', pdf_filename)
-                
-                # Extract content and generate PDF using Nuclear Swap method
-                logger.info(f"Extracting content and generating PDF using Nuclear Swap method for: {article_title[:50]}...")
-                try:
-                    # Always use the original URL we saved, not the current URL after load
-                    article_data = extract_and_save_pdf_nuclear_swap(driver, pdf_path, final_article_url)
-                    logger.info(f"PDF generated with source URL: {final_article_url}")
-                except Exception as e:
-                    logger.error(f"Failed to generate PDF with Nuclear Swap method: {str(e)}")
-                    raise
-                
-                # Get relative path for FileField
-                pdf_relative_path = os.path.join('pdfs', pdf_filename)
-                
-                # Use extracted title if available, otherwise fallback to search result title
-                final_title = article_data.get('title', article_title) if article_data else article_title
-                
-                # Create SearchResult entry
-                SearchResult.objects.create(
-                    task=search_task,
-                    title=final_title,
-                    source_url=final_article_url,
-                    pdf_file=pdf_relative_path,
-                )
-                
-                # Close current tab and switch back to main window
-                driver.close()
-                driver.switch_to.window(driver.window_handles[0])
-                
-            except Exception as e:
-                # Log error but continue with next article
-                logger.warning(f"Error processing article {idx} for task {task_id}: {str(e)}")
-                # Close any extra tabs
+        
+                # Handle cookie consent popup if present. All selector probes and
+                # the click itself happen in one in-browser call per poll, instead
+                # of a WebDriver round-trip with its own wait per selector.
+                cookie_accepted = False
                 try:
-                    while len(driver.window_handles) > 1:
-                        driver.switch_to.window(driver.window_handles[-1])
-                        driver.close()
-                    driver.switch_to.window(driver.window_handles[0])
-                except:
-                    pass
-                continue
+                    matched = WebDriverWait(driver, 5, poll_frequency=0.25).until(
+                        lambda d: d.execute_script(
+                            COOKIE_ACCEPT_JS, COOKIE_ACCEPT_CSS_SELECTORS, COOKIE_ACCEPT_TEXTS
+                        )
+                    )
+                except TimeoutException:
+                    matched = None
+
+                if matched:
+                    logger.info(f"Cookie consent button clicked ({matched})")
+                    # Wait for the popup itself to go away, not a fixed pause
+                    try:
+                        WebDriverWait(driver, 5, poll_frequency=0.25).until(
+                            EC.invisibility_of_element_located((By.ID, 'onetrust-banner-sdk'))
+                        )
+                    except TimeoutException:
+                        pass
+                    cookie_accepted = True
+                    logger.info("Cookie consent accepted")
+
+                if not cookie_accepted:
+                    logger.info("No cookie consent popup found or already accepted")
         
-        # Update status to completed
-        search_task.status = 'completed'
-        search_task.save()
-        logger.info(f"Task {task_id} completed successfully with {len(article_links)} results")
+                # The results-container wait below already covers Google Custom
+                # Search load and render; no fixed sleeps on top of it
+                wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
         
-        return f"Task {task_id} completed successfully"
+                # RadioZET uses Google Custom Search - look for results in gsc-results
+                logger.info("Looking for Google Custom Search results...")
         
+                # Wait for Google Custom Search results container
+                try:
+                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, '.gsc-results, .gsc-webResult')))
+                    logger.info("Google Custom Search results container found")
+                except TimeoutException:
+                    logger.warning("Google Custom Search results container not found, trying alternative selectors")
+        
+                # Look for article links in Google Custom Search results.
+                # Google Custom Search uses specific classes: .gsc-webResult, .gs-title, etc.
+                # One execute_script per selector returns href/text/visible for every
+                # match at once, so the old per-element get_attribute/is_displayed
+                # round-trips are gone and all URL filtering runs on plain strings.
+                articles = []
+                seen_urls = set()
+                for by, selector in ARTICLE_LINK_SELECTORS:
+                    try:
+                        # Wait until a result link is actually rendered, not just
+                        # present in the DOM
+                        wait.until(EC.visibility_of_element_located((by, selector)))
+                    except TimeoutException:
+                        continue
+
+                    rows = driver.execute_script(
+                        "return Array.from(document.querySelectorAll(arguments[0])).map(a => ({"
+                        "  href: a.href || '',"
+                        "  text: (a.innerText || '').trim(),"
+                        "  visible: a.offsetParent !== null"
+                        "}));",
+                        selector,
+                    ) or []
+
+                    for row in rows:
+                        article_url = row.get('href') or ''
+                        if not article_url or not row.get('visible'):
+                            continue
+
+                        # Clean URL - remove Google tracking redirect. A precompiled
+                        # regex instead of a full urlparse/parse_qs round per href.
+                        if 'url?q=' in article_url:
+                            redirect = _GOOGLE_REDIRECT_RE.search(article_url)
+                            if redirect:
+                                article_url = unquote(redirect.group(1))
+                                logger.debug(f"Extracted URL from Google redirect: {article_url}")
+
+                        if not article_url or 'radiozet.pl' not in article_url:
+                            continue
+
+                        # Remove any remaining tracking parameters (utm_*, ref, etc.)
+                        query_start = article_url.find('?')
+                        if query_start != -1:
+                            article_url = article_url[:query_start]
+
+                        # Ensure absolute URL; handle relative URLs for RadioZET
+                        if not article_url.startswith('http'):
+                            if article_url.startswith('/'):
+                                article_url = f"https://www.radiozet.pl{article_url}"
+                            else:
+                                article_url = f"https://www.radiozet.pl/{article_url}"
+
+                        # Exclude category/section pages
+                        if not _is_valid_article_url(article_url):
+                            logger.debug(f"Skipping short URL (likely category page): {article_url}")
+                            continue
+
+                        if article_url in seen_urls:
+                            continue
+                        seen_urls.add(article_url)
+
+                        article_title = row.get('text') or f"Article {len(articles) + 1}"
+                        articles.append((article_url, article_title))
+                        logger.debug(f"Valid article link found: {article_url}")
+                        if len(articles) >= article_count:
+                            break
+
+                    if articles:
+                        logger.info(f"Found {len(articles)} article links using selector: {selector}")
+                        break
+
+                if not articles:
+                    logger.error("Could not find article links in Google Custom Search results")
+                    raise NoSuchElementException("Could not find article links in search results")
+
+        # Fan the articles out as one task each and let the chord callback
+        # persist the rows and mark the SearchTask completed once all have
+        # reported back. With enough workers (and grid sessions) the batch
+        # scrapes in roughly the time of the slowest article instead of the
+        # sum of all of them.
+        chord(
+            scrape_article_task.s(task_id, url, title, idx, force_rescrape)
+            for idx, (url, title) in enumerate(articles, 1)
+        )(finalize_scrape_task.s(task_id))
+
+        logger.info(f"Task {task_id} dispatched {len(articles)} article tasks")
+        return f"Task {task_id} dispatched {len(articles)} article tasks"
+
     except SearchTask.DoesNotExist:
         logger.error(f"Task {task_id} not found in database")
         return f"Task {task_id} not found"
@@ -1651,18 +2261,12 @@ def scrape_news_task(task_id: str, keyword: str, article_count: int = 3):
         if search_task:
             try:
                 search_task.status = 'failed'
-                search_task.save()
+                search_task.error_message = str(e)
+                search_task.save(update_fields=['status', 'error_message'])
             except Exception as save_error:
                 logger.error(f"Failed to update task status: {str(save_error)}")
         
         # Re-raise to log in Celery
         raise Exception(error_message)
-    finally:
-        # Always close the driver
-        if driver:
-            try:
-                driver.quit()
-            except:
-                pass
 
 
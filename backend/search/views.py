@@ -1,11 +1,16 @@
 """
 Views for the search app.
 """
+from django.db import transaction
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from .models import SearchTask, SearchResult
-from .serializers import SearchTaskSerializer, SearchTaskCreateSerializer
+from .serializers import (
+    SearchTaskSerializer,
+    SearchTaskCreateSerializer,
+    SearchTaskUpdateSerializer,
+)
 from .tasks import scrape_news_task
 
 
@@ -18,62 +23,96 @@ class SearchTaskViewSet(viewsets.ModelViewSet):
     """
     queryset = SearchTask.objects.all()
     pagination_class = None  # Disable pagination to return all tasks
-    
+
+    def get_queryset(self):
+        """
+        Prefetch results so list/retrieve serialization avoids N+1 queries.
+        """
+        return SearchTask.objects.with_results()
+
+    def list(self, request, *args, **kwargs):
+        """
+        Serve the list endpoint from plain .values() dicts.
+
+        The full serializer stack is reserved for the detail endpoint;
+        for lists of flat rows it is pure overhead.
+        """
+        return Response(SearchTask.objects.list_payload())
+
     def get_serializer_class(self):
         """
         Return the appropriate serializer class based on the action.
         """
         if self.action == 'create':
             return SearchTaskCreateSerializer
+        if self.action in ('update', 'partial_update'):
+            # Never run writable validation through the field-cached read
+            # serializer (see CachedFieldsMixin)
+            return SearchTaskUpdateSerializer
         return SearchTaskSerializer
     
     def create(self, request, *args, **kwargs):
         """
         Create a new SearchTask and trigger the Celery scraping task.
-        
-        Returns the task ID (UUID) in the response.
+
+        Returns the task ID (UUID) in the response. The Celery dispatch is
+        deferred to transaction.on_commit, so a fast worker can never pick
+        the task up before its row is visible in the database.
         """
         import logging
         logger = logging.getLogger(__name__)
-        
+
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        
-        # Create the SearchTask instance
-        search_task = serializer.save()
-        
-        try:
-            # Trigger the Celery task asynchronously with task_id, keyword, and article_count
-            celery_task = scrape_news_task.delay(
-                str(search_task.id), 
+
+        search_task = None
+        dispatched = {}
+
+        def _dispatch():
+            dispatched['celery_task'] = scrape_news_task.delay(
+                str(search_task.id),
                 search_task.keyword,
                 search_task.article_count
             )
-            logger.info(f"Created search task {search_task.id} with Celery task {celery_task.id} for {search_task.article_count} articles")
+            logger.info(f"Created search task {search_task.id} with Celery task {dispatched['celery_task'].id} for {search_task.article_count} articles")
+
+        try:
+            with transaction.atomic():
+                search_task = serializer.save()
+                transaction.on_commit(_dispatch)
+            # on_commit callbacks ran when the atomic block exited, so a
+            # broker failure surfaces here — after the INSERT committed
         except Exception as e:
-            # If Celery task creation fails, mark task as failed
+            if search_task is None:
+                raise
+            # If Celery task creation fails, mark task as failed; one
+            # targeted UPDATE instead of a full-row save
             logger.error(f"Failed to create Celery task for {search_task.id}: {str(e)}")
-            search_task.status = 'failed'
-            search_task.save()
+            error_message = 'Failed to start background task. Please check Celery worker.'
+            SearchTask.objects.filter(pk=search_task.pk).update(
+                status='failed', error_message=error_message
+            )
             return Response(
                 {
                     'id': str(search_task.id),
                     'keyword': search_task.keyword,
                     'status': 'failed',
-                    'error': 'Failed to start background task. Please check Celery worker.',
-                    'created_at': search_task.created_at,
+                    'error': error_message,
+                    'created_at': int(search_task.created_at.timestamp() * 1000),
                 },
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
-        
-        # Return the SearchTask ID
+
+        # Return the SearchTask ID; the fields are already in memory, no
+        # re-fetch needed
+        celery_task = dispatched.get('celery_task')
         return Response(
             {
                 'id': str(search_task.id),
                 'keyword': search_task.keyword,
                 'status': search_task.status,
-                'created_at': search_task.created_at,
-                'celery_task_id': celery_task.id,
+                'created_at': int(search_task.created_at.timestamp() * 1000),
+                'celery_task_id': celery_task.id if celery_task else None,
             },
             status=status.HTTP_201_CREATED
         )